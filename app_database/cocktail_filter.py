@@ -0,0 +1,155 @@
+# cocktail_filter.py
+import itertools
+import threading
+from collections import OrderedDict
+
+from app_database.search_index import FuzzySearchIndex
+from utilities import remove_diacritics
+
+FUZZY_RESULT_LIMIT = 50
+RESULT_CACHE_SIZE = 64  # filter combinations whose index lists are kept
+
+
+class CocktailFilterIndex:
+    """
+    Search names and per-attribute index sets for the cocktail book filters.
+
+    Built once per catalog load. Results are indexes into the cocktails list,
+    and combining the favorites/easy/stirred/flavor toggles is just a set
+    intersection instead of a pass over every cocktail per toggle.
+    """
+
+    def __init__(self, cocktails, version=0):
+        self.cocktails = cocktails
+        self.version = version  # catalog/inventory version the cocktails list belongs to
+        self.search_names = [remove_diacritics(c["name"]).lower() for c in cocktails]
+
+        self.favorites = set()
+        self.easy = set()
+        self.stirred = set()
+        self.by_flavor = {}  # normalized flavor value -> index set
+        for i, c in enumerate(cocktails):
+            if c.get("is_favorite", False):
+                self.favorites.add(i)
+            if c.get("is_easy_to_make", False):
+                self.easy.add(i)
+            if (c.get("prep_method") or "") == "Stirred":
+                self.stirred.add(i)
+            flavor = (c.get("flavor") or "").strip().lower()
+            self.by_flavor.setdefault(flavor, set()).add(i)
+
+        self._flavor_cache = {}  # selected flavor -> index set
+        self._search_query = ""  # query the cached matches belong to
+        self._search_matches = None
+        self._fuzzy_index = None  # built on the first search
+
+        # LRU of filter results. Keys carry the catalog version, and the favorites
+        # version only when the favorites toggle is on: (un)favoriting a cocktail
+        # leaves every result that doesn't filter on favorites valid.
+        self._favorites_version = 0
+        self._results = OrderedDict()
+        self._results_lock = threading.Lock()  # filter() runs on the GUI thread or a worker
+
+    def flavor_indexes(self, flavor):
+        """Indexes of cocktails whose flavor contains the selected one."""
+        selected = flavor.strip().lower()
+        if selected not in self._flavor_cache:
+            matches = set()
+            for value, indexes in self.by_flavor.items():
+                if selected in value:
+                    matches |= indexes
+            self._flavor_cache[selected] = matches
+        return self._flavor_cache[selected]
+
+    def search_matches(self, search_text):
+        """
+        Indexes of the cocktails matching the search text, or None when there
+        is no search: the ones whose name contains it (in catalog order), then
+        the ones using a matching ingredient, then ranked fuzzy matches on
+        names and ingredients, each cocktail once. If the query extends the
+        previous one, only the previous name matches are checked again.
+        """
+        query = remove_diacritics(search_text).lower()
+        if not query:
+            return None
+
+        if self._search_query and query.startswith(self._search_query):
+            candidates = self._search_matches
+        else:
+            candidates = range(len(self.search_names))
+        names = self.search_names
+        self._search_matches = [i for i in candidates if query in names[i]]
+        self._search_query = query
+
+        matches = list(self._search_matches)
+        seen = set(matches)
+        others = itertools.chain(
+            self.fuzzy_index().ingredient_matches(search_text), (i for i, _ in self.fuzzy_search(search_text))
+        )
+        for i in others:
+            if i not in seen:
+                seen.add(i)
+                matches.append(i)
+        return matches
+
+    def fuzzy_index(self):
+        """The name/ingredient search index, built on the first search."""
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzySearchIndex(self.cocktails)
+        return self._fuzzy_index
+
+    def fuzzy_search(self, search_text, limit=FUZZY_RESULT_LIMIT):
+        """Typo tolerant ranked search, [(index, score), ...] best first."""
+        return self.fuzzy_index().search(search_text, limit)
+
+    def set_favorite(self, i, value):
+        """Keep the favorites set in step when a cocktail is (un)favorited."""
+        if value == (i in self.favorites):
+            return
+        if value:
+            self.favorites.add(i)
+        else:
+            self.favorites.discard(i)
+        self._favorites_version += 1
+
+    def filter(self, search_text="", favorites=False, easy=False, stirred=False, flavor="All"):
+        """
+        Apply the book screen filters, returns the matching indexes in catalog
+        order, or in search_matches() order when there is a search.
+        Results are cached, the returned list must not be modified.
+        """
+        key = (self.version, self._favorites_version if favorites else None,
+               remove_diacritics(search_text).lower(), easy, stirred, flavor.strip().lower())
+        with self._results_lock:
+            indexes = self._results.get(key)
+            if indexes is not None:
+                self._results.move_to_end(key)
+                return indexes
+
+        indexes = self._filter(search_text, favorites, easy, stirred, flavor)
+        with self._results_lock:
+            self._results[key] = indexes
+            if len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return indexes
+
+    def _filter(self, search_text, favorites, easy, stirred, flavor):
+        required = []
+        if favorites:
+            required.append(self.favorites)
+        if easy:
+            required.append(self.easy)
+        if stirred:
+            required.append(self.stirred)
+        if flavor.lower() != "all":
+            required.append(self.flavor_indexes(flavor))
+
+        matches = self.search_matches(search_text)
+        if not required:
+            return list(range(len(self.cocktails))) if matches is None else matches
+
+        required.sort(key=len)  # intersect starting from the smallest set
+        allowed = required[0].intersection(*required[1:])
+        if matches is None:
+            return sorted(allowed)
+        return [i for i in matches if i in allowed]
@@ -0,0 +1,193 @@
+# cocktail_record.py
+import sys
+from collections.abc import Mapping
+
+_MISSING = object()  # slot value for a field the source dict didn't have
+_DERIVED = object()  # made_from equal to the ingredient names joined with ", "
+
+# Fields kept in their own slot; the string ones are interned since flavors, glasses etc. repeat a lot
+_SLOT_FIELDS = ("name", "made_from", "flavor", "prep_method", "glass", "garnish", "abv", "times_made")
+_INTERNED_FIELDS = {"name", "flavor", "prep_method", "glass", "garnish", "abv"}
+# Boolean fields packed in one int: bit 2k = present, bit 2k+1 = value. Values that aren't
+# bools (None, 0/1, "yes") go to the overflow dict unchanged, so to_dict() gives the source back
+_FLAG_FIELDS = ("is_favorite", "is_easy_to_make")
+_FLAG_BITS = {field: 2 * k for k, field in enumerate(_FLAG_FIELDS)}
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class IngredientTable:
+    """
+    Interns ingredient names to small int ids shared by every record of a
+    catalog, plus the small tuples (amounts, overflow keys) that repeat between records.
+    """
+
+    def __init__(self):
+        self.names = []
+        self.ids = {}
+        self.tuples = {}
+
+    def intern_tuple(self, values):
+        values = tuple(_intern(v) for v in values)
+        try:
+            return self.tuples.setdefault(values, values)
+        except TypeError:  # unhashable values can't be shared
+            return values
+
+    def id_for(self, name):
+        ingredient_id = self.ids.get(name)
+        if ingredient_id is None:
+            ingredient_id = self.ids[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return ingredient_id
+
+
+INGREDIENTS = IngredientTable()
+
+
+class CocktailRecord(Mapping):
+    """
+    Compact, read-mostly cocktail record with a dict-compatible accessor.
+
+    Screens keep using c["name"], c.get("is_favorite"), c.get("flavor", "")...
+    but the record stores its known fields in __slots__, its flags in one int
+    and its ingredient names as ids into an IngredientTable. Unknown fields
+    (instructions etc.) go to a small overflow dict.
+    """
+
+    __slots__ = _SLOT_FIELDS + ("_flags", "_ingredient_ids", "_amounts", "_table", "_extra_keys", "_extra_values")
+
+    def __init__(self, data, table=INGREDIENTS):
+        self._flags = 0
+        self._ingredient_ids = None
+        self._amounts = None
+        self._table = table
+        self._extra_keys = ()  # shared between records with the same extra fields
+        self._extra_values = ()
+        for field in _SLOT_FIELDS:
+            value = data.get(field, _MISSING)
+            setattr(self, field, _intern(value) if field in _INTERNED_FIELDS else value)
+
+        extra = {}
+        for key, value in data.items():
+            if key in _FLAG_BITS and isinstance(value, bool):
+                self[key] = value
+            elif key == "ingredients":
+                if not self._set_ingredients(value):
+                    extra[key] = value
+            elif key not in _SLOT_FIELDS:
+                extra[key] = value
+        if extra:
+            self._extra_keys = table.intern_tuple(extra)
+            self._extra_values = tuple(_intern(v) for v in extra.values())
+        if self.made_from is not _MISSING and self.made_from == self._joined_names():
+            self.made_from = _DERIVED
+
+    def __getitem__(self, key):
+        if key in _SLOT_FIELDS:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return self._joined_names() if value is _DERIVED else value
+        if key in _FLAG_BITS:
+            bit = _FLAG_BITS[key]
+            if self._flags >> bit & 1:
+                return bool(self._flags >> (bit + 1) & 1)
+        if key == "ingredients" and self._ingredient_ids is not None:
+            names = [self._table.names[i] for i in self._ingredient_ids]
+            return dict(zip(names, self._amounts)) if self._amounts is not None else names
+        if key in self._extra_keys:
+            return self._extra_values[self._extra_keys.index(key)]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _SLOT_FIELDS:
+            setattr(self, key, _intern(value) if key in _INTERNED_FIELDS else value)
+        elif key in _FLAG_BITS:
+            bit = _FLAG_BITS[key]
+            if isinstance(value, bool):
+                self._flags = self._flags & ~(3 << bit) | 1 << bit | value << (bit + 1)
+                if key in self._extra_keys:
+                    self._set_extra(key, _MISSING)
+            else:
+                self._flags &= ~(3 << bit)
+                self._set_extra(key, value)
+        else:
+            if key == "ingredients":
+                if self.made_from is _DERIVED:
+                    self.made_from = self._joined_names()
+                if self._set_ingredients(value):
+                    self._set_extra(key, _MISSING)
+                    return
+                self._ingredient_ids = self._amounts = None
+            self._set_extra(key, value)
+
+    def _set_extra(self, key, value):
+        extra = dict(zip(self._extra_keys, self._extra_values))
+        if value is _MISSING:
+            extra.pop(key, None)
+        else:
+            extra[key] = value
+        self._extra_keys = self._table.intern_tuple(extra)
+        self._extra_values = tuple(extra.values())
+
+    def _joined_names(self):
+        names = self.ingredient_names()
+        return ", ".join(names) if names is not None else None
+
+    def _set_ingredients(self, value):
+        """Intern a {name: amount} dict or a list of names, returns False for other shapes."""
+        if isinstance(value, dict) and all(isinstance(name, str) for name in value):
+            self._ingredient_ids = tuple(self._table.id_for(name) for name in value)
+            self._amounts = self._table.intern_tuple(value.values())
+            return True
+        if isinstance(value, list) and all(isinstance(name, str) for name in value):
+            self._ingredient_ids = tuple(self._table.id_for(name) for name in value)
+            self._amounts = None
+            return True
+        return False
+
+    def get(self, key, default=None):
+        # Mapping.get goes through a KeyError for missing keys, this is on the hot filter path
+        if key in _SLOT_FIELDS:
+            value = getattr(self, key)
+            if value is _MISSING:
+                return default
+            return self._joined_names() if value is _DERIVED else value
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def ingredient_names(self):
+        """Ingredient names without rebuilding the ingredients dict, None if not interned."""
+        if self._ingredient_ids is None:
+            return None
+        return [self._table.names[i] for i in self._ingredient_ids]
+
+    def __iter__(self):
+        for field in _SLOT_FIELDS:
+            if getattr(self, field) is not _MISSING:
+                yield field
+        for field, bit in _FLAG_BITS.items():
+            if self._flags >> bit & 1:
+                yield field
+        if self._ingredient_ids is not None:
+            yield "ingredients"
+        yield from self._extra_keys
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"CocktailRecord({self.to_dict()!r})"
+
+    def to_dict(self):
+        return {key: self[key] for key in self}
+
+
+def compact_cache(cocktail_cache, table=INGREDIENTS):
+    """Turn a { name: cocktail dict } cache into { name: CocktailRecord }, keeping the order."""
+    return {_intern(key): CocktailRecord(cocktail, table) for key, cocktail in cocktail_cache.items()}
@@ -0,0 +1,145 @@
+# event_log.py
+import json
+import os
+
+from utilities import APP_DIR
+
+COMPACT_EVERY = 1000  # events appended before the log is folded into the state file
+
+
+class CocktailEventLog:
+    """
+    Append-only log of "made a drink" and favorite changes.
+
+    The recipe data is never rewritten for these: every change is one appended
+    line, and the log is periodically compacted into a small state file of
+    per-cocktail deltas. times_made and is_favorite of the cocktail cache are
+    the base values, the log's values are applied on top of them. The total
+    number of drinks made is a running counter.
+    """
+
+    def __init__(self, log_path=os.path.join(APP_DIR, "cocktail_events.jsonl"),
+                 state_path=os.path.join(APP_DIR, "cocktail_stats.json")):
+        self.log_path = log_path
+        self.state_path = state_path
+        self.made = {}  # cocktail key -> drinks made since the base data
+        self.favorites = {}  # cocktail key -> favorite override
+        self.made_total = 0
+        self.base_total = 0  # times_made summed over the base data, see set_base_total()
+        self.seq = 0  # number of the last event, also kept in the state file
+        self._pending = 0  # events in the log file since the last compaction
+        self._log_file = None
+
+    def load(self):
+        """
+        Read the state file and replay the log, compacting it if it wasn't empty.
+        That includes a log holding only a torn line or events already in the
+        state file: appending after a fragment without a newline would glue the
+        next event onto it.
+        """
+        if os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.made = state.get("made", {})
+            self.favorites = state.get("favorites", {})
+            self.seq = state.get("seq", 0)
+        log_written = False
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    log_written = True
+                    try:
+                        event = json.loads(line)
+                    except ValueError:  # torn last line from a crash mid-write
+                        continue
+                    if event["seq"] > self.seq:  # older ones are already in the state file
+                        self._apply(event)
+                        self._pending += 1
+        self.made_total = sum(self.made.values())
+        if log_written:
+            self.compact()
+
+    def set_base_total(self, base_total):
+        """times_made summed over the cocktail cache, e.g. from the startup snapshot."""
+        self.base_total = base_total
+
+    def total_times_made(self):
+        return self.base_total + self.made_total
+
+    def times_made(self, key, base=0):
+        return base + self.made.get(key, 0)
+
+    def is_favorite(self, key, base=False):
+        return self.favorites.get(key, base)
+
+    def apply_row(self, key, cocktail):
+        """Overlay the logged values on one cocktail (dict or record), in memory only."""
+        if key in self.made:
+            cocktail["times_made"] = self.times_made(key, cocktail.get("times_made", 0) or 0)
+        if key in self.favorites:
+            cocktail["is_favorite"] = self.favorites[key]
+        return cocktail
+
+    def apply(self, cocktail_cache):
+        """
+        Overlay the logged values on a cocktail cache. Only the changed keys are
+        touched; a SQLite table applies them as rows are read.
+        """
+        if hasattr(cocktail_cache, "row_hook"):
+            cocktail_cache.row_hook = self.apply_row
+            return
+        for key in self.made.keys() | self.favorites.keys():
+            cocktail = cocktail_cache.get(key)
+            if cocktail is not None:
+                self.apply_row(key, cocktail)
+
+    def record_made(self, key, cocktail=None, count=1):
+        """One appended line; cocktail (if given) gets its times_made bumped too."""
+        self._append({"op": "made", "key": key, "count": count})
+        if cocktail is not None:
+            cocktail["times_made"] = (cocktail.get("times_made", 0) or 0) + count
+        return self.total_times_made()
+
+    def set_favorite(self, key, value, cocktail=None):
+        self._append({"op": "favorite", "key": key, "value": bool(value)})
+        if cocktail is not None:
+            cocktail["is_favorite"] = bool(value)
+
+    def compact(self):
+        """
+        Fold the log into the state file and start a new log. The state file
+        is replaced atomically and remembers the last event number, so a crash
+        before the truncate doesn't replay events twice.
+        """
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"seq": self.seq, "made": self.made, "favorites": self.favorites}, f)
+        os.replace(tmp_path, self.state_path)
+        self.close()
+        open(self.log_path, "w", encoding="utf-8").close()
+        self._pending = 0
+
+    def close(self):
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def _append(self, event):
+        self.seq += 1
+        event["seq"] = self.seq
+        if self._log_file is None:
+            self._log_file = open(self.log_path, "a", encoding="utf-8")
+        self._log_file.write(json.dumps(event) + "\n")
+        self._log_file.flush()
+        self._apply(event)
+        self._pending += 1
+        if self._pending >= COMPACT_EVERY:
+            self.compact()
+
+    def _apply(self, event):
+        self.seq = max(self.seq, event["seq"])
+        if event["op"] == "made":
+            self.made[event["key"]] = self.made.get(event["key"], 0) + event["count"]
+            self.made_total += event["count"]
+        elif event["op"] == "favorite":
+            self.favorites[event["key"]] = event["value"]
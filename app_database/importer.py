@@ -0,0 +1,190 @@
+# importer.py
+"""
+Headless bulk recipe import:
+
+    python -m app_database.importer recipes.jsonl [--db path] [--workers 4]
+
+Records stream through parse -> canonicalize -> batched writes, so only a
+few batches are in memory at any time. Duplicates are left to the database:
+a name whose name_key() (no diacritics or case) is stored already is skipped.
+"""
+import argparse
+import csv
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from app_database.makeable_index import recipe_ingredients
+from app_database.sqlite_db import DEFAULT_DB_PATH, open_databases
+
+BATCH_SIZE = 1000  # records per canonicalization task and per write transaction
+PENDING_BATCHES = 4  # batches queued per worker process, bounds memory with a pool
+
+_BOOLEAN_FIELDS = ("is_favorite", "is_easy_to_make")
+_TRUE_STRINGS = {"1", "true", "yes", "y"}
+
+
+def read_records(path):
+    """
+    Yield raw recipe dicts from a .jsonl or .csv file, one line at a time.
+    A JSONL line that doesn't parse is yielded as None, it counts as skipped.
+    """
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield None
+
+
+def _parse_ingredients(value):
+    """CSV cells hold JSON ({name: amount} / [names]) or a comma separated list."""
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped[:1] in ("{", "["):
+            return json.loads(stripped)
+        return [name for name in stripped.split(",") if name.strip()]
+    return value or []
+
+
+def _clean_ingredients(value):
+    """Stripped source ingredient names without repeats, {name: amount} or [names] like the input."""
+    value = _parse_ingredients(value)
+    if isinstance(value, dict):
+        items = value.items()
+    else:
+        items = [(i.get("name", ""), i.get("amount", "")) if isinstance(i, dict) else (i, None) for i in value]
+    cleaned = {}
+    for name, amount in items:
+        if name and name.strip():
+            cleaned.setdefault(name.strip(), amount)
+    if all(amount is None for amount in cleaned.values()):
+        return list(cleaned)
+    return {name: "" if amount is None else amount for name, amount in cleaned.items()}
+
+
+def normalize_record(raw):
+    """
+    Clean one parsed record: strip the name and the ingredient names and
+    coerce the CSV strings. The ingredients keep their source names; their
+    canonical names go to "_canonical", for the cocktail_ingredients table.
+    Returns None for records without a name, raises ValueError/TypeError for
+    records that don't parse.
+    """
+    if not isinstance(raw, dict):
+        raise TypeError(f"Expected a recipe object, got {type(raw).__name__}")
+    name = " ".join(str(raw.get("name") or "").split())
+    if not name:
+        return None
+    record = {key: value for key, value in raw.items() if value not in (None, "")}
+    record["name"] = name
+    record["ingredients"] = _clean_ingredients(record.get("ingredients", []))
+    record.setdefault("made_from", ", ".join(record["ingredients"]))
+    for field in _BOOLEAN_FIELDS:
+        if isinstance(record.get(field), str):
+            record[field] = record[field].strip().lower() in _TRUE_STRINGS
+    if isinstance(record.get("times_made"), str):
+        record["times_made"] = int(float(record["times_made"] or 0))  # "3" and "3.0"
+    record["_canonical"] = sorted(recipe_ingredients(record))
+    return record
+
+
+def normalize_batch(raw_records):
+    """
+    Process pool task: a list of raw records in, normalized ones out. Records
+    that can't be used come out as None, one bad record doesn't stop the import.
+    """
+    normalized = []
+    for raw in raw_records:
+        try:
+            normalized.append(None if raw is None else normalize_record(raw))
+        except (ValueError, TypeError, AttributeError):  # bad JSON cell, number, ingredient list item
+            normalized.append(None)
+    return normalized
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _bounded_map(executor, fn, batches, pending):
+    """executor.map() that keeps at most `pending` tasks in flight instead of submitting everything."""
+    futures = deque()
+    for batch in batches:
+        futures.append(executor.submit(fn, batch))
+        if len(futures) >= pending:
+            yield futures.popleft().result()
+    while futures:
+        yield futures.popleft().result()
+
+
+def normalized_batches(records, batch_size=BATCH_SIZE, workers=0):
+    """Normalize the raw record stream batch by batch, in a process pool when workers > 0."""
+    batches = batched(records, batch_size)
+    if workers <= 0:
+        yield from map(normalize_batch, batches)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _bounded_map(executor, normalize_batch, batches, workers * PENDING_BATCHES)
+
+
+def import_records(records, cocktail_db, batch_size=BATCH_SIZE, workers=0, progress=None):
+    """
+    Add a stream of raw recipe dicts to cocktail_db.cache (a CocktailTable).
+    Rows already in the database are kept: a record whose name matches one
+    there, or an earlier one in the stream, without diacritics or case counts
+    as a duplicate. progress(stats) is called after every written batch.
+    Returns the stats dict, "skipped" counts the records without a name or
+    that didn't parse.
+    """
+    stats = {"read": 0, "imported": 0, "duplicates": 0, "skipped": 0}
+    for batch in normalized_batches(records, batch_size, workers):
+        stats["read"] += len(batch)
+        rows = [(record["name"], record, record.pop("_canonical")) for record in batch if record is not None]
+        stats["skipped"] += len(batch) - len(rows)
+        if rows:
+            inserted = cocktail_db.cache.add_many(rows)
+            stats["imported"] += inserted
+            stats["duplicates"] += len(rows) - inserted
+        if progress is not None:
+            progress(stats)
+    return stats
+
+
+def import_file(path, cocktail_db, batch_size=BATCH_SIZE, workers=0, progress=None):
+    """Import a .jsonl/.csv recipe dump, see import_records()."""
+    return import_records(read_records(path), cocktail_db, batch_size, workers, progress)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import a JSONL/CSV recipe dump into the SQLite recipe store.")
+    parser.add_argument("path", help=".jsonl or .csv file, one recipe per line/row")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="SQLite database to write to")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=0, help="canonicalization processes, 0 = inline")
+    args = parser.parse_args(argv)
+
+    _, cocktail_db = open_databases(args.db)
+    cocktail_db.load_cache()
+    try:
+        stats = import_file(
+            args.path, cocktail_db, args.batch_size, args.workers,
+            progress=lambda s: print(f"\r{s['imported']} imported, {s['duplicates']} duplicates", end="", flush=True),
+        )
+    finally:
+        cocktail_db.close()
+    print(f"\nRead {stats['read']} records: {stats['imported']} imported, "
+          f"{stats['duplicates']} duplicates, {stats['skipped']} skipped (no name or malformed)")
+
+
+if __name__ == "__main__":
+    main()
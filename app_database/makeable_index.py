@@ -0,0 +1,214 @@
+# makeable_index.py
+import heapq
+from collections import Counter
+
+from app_database.cocktail_record import CocktailRecord
+from utilities import canonicalize
+
+
+def recipe_ingredients(cocktail):
+    """
+    Return the set of canonical ingredient names a cocktail needs.
+
+    The "ingredients" field may be a dict of {name: amount}, a list of names,
+    a list of {"name": ...} dicts or a comma separated string.
+    """
+    if isinstance(cocktail, CocktailRecord) and cocktail.ingredient_names() is not None:
+        return {canonicalize(n) for n in cocktail.ingredient_names() if n and n.strip()}
+
+    ingredients = cocktail.get("ingredients") or ()
+    if isinstance(ingredients, dict):
+        names = ingredients.keys()
+    elif isinstance(ingredients, str):
+        names = ingredients.split(",")
+    else:
+        names = [i.get("name", "") if isinstance(i, dict) else i for i in ingredients]
+    return {canonicalize(n) for n in names if n and n.strip()}
+
+
+def inventory_ingredients(inventory_cache):
+    """
+    Return the set of canonical ingredient names in the inventory cache
+    (a dict keyed by ingredient name, or any iterable of names).
+    """
+    return {canonicalize(n) for n in inventory_cache if n and n.strip()}
+
+
+class MakeableIndex:
+    """
+    Inverted ingredient -> recipes index with a per-recipe missing counter.
+
+    A recipe is makeable when its missing counter is zero, so adding or
+    removing one inventory ingredient only touches the recipes that use it
+    instead of rescanning the whole recipe book.
+    """
+
+    def __init__(self, cocktail_cache, inventory_cache=()):
+        self.cocktail_cache = cocktail_cache
+        self.order = {}  # recipe key -> position in the cache, keeps results stable
+        self.requires = {}  # recipe key -> set of canonical ingredients
+        self.used_by = {}  # canonical ingredient -> set of recipe keys
+        self.missing = {}  # recipe key -> number of ingredients not in stock
+        self.by_missing = {}  # number of missing ingredients -> set of recipe keys
+        self.in_stock = set()
+        self.makeable = set()
+        self._makeable_list = None
+
+        for position, (key, cocktail) in enumerate(cocktail_cache.items()):
+            needed = recipe_ingredients(cocktail)
+            self.order[key] = position
+            self.requires[key] = needed
+            self.missing[key] = len(needed)
+            for ingredient in needed:
+                self.used_by.setdefault(ingredient, set()).add(key)
+
+        for key, count in self.missing.items():
+            self.by_missing.setdefault(count, set()).add(key)
+        self.makeable = set(self.by_missing.get(0, ()))
+        for ingredient in inventory_ingredients(inventory_cache):
+            self.add_ingredient(ingredient, canonical=True)
+
+    def add_ingredient(self, ingredient, canonical=False):
+        """
+        Mark an ingredient as in stock. Returns the keys of recipes that just became makeable.
+        """
+        if not canonical:
+            ingredient = canonicalize(ingredient)
+        if ingredient in self.in_stock:
+            return []
+        self.in_stock.add(ingredient)
+
+        unlocked = []
+        for key in self.used_by.get(ingredient, ()):
+            self._set_missing(key, self.missing[key] - 1)
+            if self.missing[key] == 0:
+                self.makeable.add(key)
+                unlocked.append(key)
+        if unlocked:
+            self._makeable_list = None
+        return unlocked
+
+    def remove_ingredient(self, ingredient, canonical=False):
+        """
+        Mark an ingredient as out of stock. Returns the keys of recipes that are no longer makeable.
+        """
+        if not canonical:
+            ingredient = canonicalize(ingredient)
+        if ingredient not in self.in_stock:
+            return []
+        self.in_stock.discard(ingredient)
+
+        lost = []
+        for key in self.used_by.get(ingredient, ()):
+            if self.missing[key] == 0:
+                self.makeable.discard(key)
+                lost.append(key)
+            self._set_missing(key, self.missing[key] + 1)
+        if lost:
+            self._makeable_list = None
+        return lost
+
+    def _set_missing(self, key, count):
+        bucket = self.by_missing[self.missing[key]]
+        bucket.discard(key)
+        if not bucket:
+            del self.by_missing[self.missing[key]]
+        self.missing[key] = count
+        self.by_missing.setdefault(count, set()).add(key)
+
+    def sync_inventory(self, inventory_cache):
+        """
+        Bring the index in line with an inventory cache, touching only the
+        ingredients that changed. Returns (unlocked_keys, lost_keys).
+        """
+        current = inventory_ingredients(inventory_cache)
+        unlocked, lost = [], []
+        for ingredient in self.in_stock - current:
+            lost.extend(self.remove_ingredient(ingredient, canonical=True))
+        for ingredient in current - self.in_stock:
+            unlocked.extend(self.add_ingredient(ingredient, canonical=True))
+        return unlocked, lost
+
+    def is_makeable(self, key):
+        return key in self.makeable
+
+    def makeable_keys(self):
+        """Keys of the makeable recipes, in recipe book order."""
+        return sorted(self.makeable, key=self.order.__getitem__)
+
+    def get_makeable_cocktails(self):
+        """
+        Same shape as CocktailDB.get_makeable_cocktails: a list of cocktail
+        dicts in recipe book order, read from the counters.
+        """
+        if self._makeable_list is None:
+            self._makeable_list = [self.cocktail_cache[key] for key in self.makeable_keys()]
+        return self._makeable_list
+
+    def missing_ingredients(self, key):
+        """Canonical ingredients a recipe still needs."""
+        return self.requires[key] - self.in_stock
+
+    def almost_makeable(self, max_missing=2, limit=None):
+        """
+        Recipes missing between 1 and max_missing ingredients, fewest missing
+        first: [(key, missing ingredients), ...]. Read from the per-count
+        buckets, recipes missing more are never looked at.
+        """
+        results = []
+        for count in range(1, max_missing + 1):
+            keys = sorted(self.by_missing.get(count, ()), key=self.order.__getitem__)
+            results.extend((key, self.missing_ingredients(key)) for key in keys)
+            if limit is not None and len(results) >= limit:
+                return results[:limit]
+        return results
+
+    def best_purchases(self, limit=10):
+        """
+        Which single purchase unlocks the most new recipes:
+        [(ingredient, [recipe keys it unlocks]), ...] best first.
+        """
+        unlocks = {}
+        for key in self.by_missing.get(1, ()):
+            (ingredient,) = self.missing_ingredients(key)
+            unlocks.setdefault(ingredient, []).append(key)
+        best = heapq.nsmallest(limit, unlocks.items(), key=lambda item: (-len(item[1]), item[0]))
+        return [(ingredient, sorted(keys, key=self.order.__getitem__)) for ingredient, keys in best]
+
+    def shopping_list(self, budget=3):
+        """
+        Greedy plan for up to `budget` purchases: each step buys the ingredient
+        that unlocks the most recipes given what was already planned, ties go
+        to the one bringing the most other recipes closer.
+        Returns [(ingredient, [recipe keys it unlocks]), ...] in buying order.
+        """
+        # Only recipes that can still be completed within the budget matter
+        remaining = {}
+        for count in range(1, budget + 1):
+            for key in self.by_missing.get(count, ()):
+                remaining[key] = set(self.missing_ingredients(key))
+
+        plan = []
+        while remaining and len(plan) < budget:
+            unlocks = Counter()
+            progress = Counter()
+            for needed in remaining.values():
+                if len(needed) == 1:
+                    unlocks[next(iter(needed))] += 1
+                for ingredient in needed:
+                    progress[ingredient] += 1 / len(needed)
+            ((_, _, ingredient),) = heapq.nsmallest(
+                1, ((-unlocks[i], -progress[i], i) for i in progress)
+            )
+
+            unlocked = []
+            left = budget - len(plan) - 1
+            for key in list(remaining):
+                needed = remaining[key]
+                needed.discard(ingredient)
+                if not needed:
+                    unlocked.append(key)
+                if not needed or len(needed) > left:
+                    del remaining[key]
+            plan.append((ingredient, sorted(unlocked, key=self.order.__getitem__)))
+        return plan
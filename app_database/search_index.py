@@ -0,0 +1,210 @@
+# search_index.py
+import heapq
+import re
+from collections import Counter
+from itertools import islice
+
+from app_database.makeable_index import recipe_ingredients
+from utilities import remove_diacritics, canonicalize
+
+NAME_WEIGHT = 1.0
+INGREDIENT_WEIGHT = 0.7  # an ingredient hit ranks below a name hit
+MIN_SIMILARITY = 0.5  # below this a term is not considered a typo of the query word
+MAX_TERMS_PER_WORD = 40  # vocabulary terms a query word can match
+MAX_POSTINGS_PER_TERM = 500  # cocktails a matched term contributes as candidates, its best ones
+MAX_CANDIDATES = 30000  # multi word queries: up to this, every posting of the rarest word is a candidate
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def words(text):
+    return _WORD_RE.findall(remove_diacritics(text).lower())
+
+
+def trigrams(word):
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, max_distance):
+    """
+    Optimal string alignment distance (Levenshtein + adjacent transpositions),
+    gives up and returns max_distance + 1 once the distance can't stay within bounds.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > max_distance:
+            return max_distance + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class FuzzySearchIndex:
+    """
+    Typo tolerant, ranked search over cocktail names and canonical ingredients.
+
+    Query words are matched against the term vocabulary through a trigram
+    index (so "negorni" still finds "negroni"), then the posting lists of
+    the matching terms score the cocktails. No Qt involved, so it can be
+    used from CocktailBookScreen or headlessly.
+
+    Posting lists are kept in ranking order (name hits first, then shorter
+    names), so a term only has to hand out its first MAX_POSTINGS_PER_TERM
+    cocktails. For one word queries that gives the same top results as
+    scanning everything (as long as the limit is below the cap). Queries of
+    several words score the postings of their rarest word, or the best
+    postings of any word when even that one is very common.
+    """
+
+    def __init__(self, cocktails):
+        self.cocktails = cocktails
+        self.postings = {}  # term -> {cocktail index: field weight}
+        self.used_by = {}  # canonical ingredient -> indexes of the cocktails using it, in catalog order
+        for i, c in enumerate(cocktails):
+            for term in words(c["name"]):
+                self.postings.setdefault(term, {})[i] = NAME_WEIGHT
+            for ingredient in recipe_ingredients(c):
+                self.used_by.setdefault(ingredient, []).append(i)
+                for term in words(ingredient):
+                    docs = self.postings.setdefault(term, {})
+                    if docs.get(i, 0) < INGREDIENT_WEIGHT:
+                        docs[i] = INGREDIENT_WEIGHT
+
+        name_lengths = [len(c["name"]) for c in cocktails]
+        for term, docs in self.postings.items():
+            ranked = sorted(docs, key=lambda i: (-docs[i], name_lengths[i], i))
+            self.postings[term] = {i: docs[i] for i in ranked}
+
+        self.gram_index = {}  # trigram -> terms containing it
+        self.gram_counts = {}  # term -> number of distinct trigrams
+        for term in self.postings:
+            grams = trigrams(term)
+            self.gram_counts[term] = len(grams)
+            for gram in grams:
+                self.gram_index.setdefault(gram, []).append(term)
+
+    def term_matches(self, word):
+        """
+        Vocabulary terms similar to a query word, as {term: similarity in (0, 1]}.
+        """
+        query_grams = trigrams(word)
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self.gram_index.get(gram, ()))
+
+        max_distance = 1 if len(word) < 6 else 2
+        # q-gram lemma: within max_distance edits a term keeps at least this many of the query's trigrams
+        min_shared = len(query_grams) - 3 * max_distance
+        scored = {}
+        for term, count in shared.items():
+            score = 2 * count / (len(query_grams) + self.gram_counts[term])  # Dice over trigrams
+            if term.startswith(word):
+                score = max(score, 0.8 + 0.2 * len(word) / len(term))  # as-you-type prefix
+            elif count >= min_shared:
+                distance = edit_distance(word, term, max_distance)
+                if distance <= max_distance:
+                    score = max(score, 1 - distance / max(len(word), len(term)))
+            if score >= MIN_SIMILARITY:
+                scored[term] = score
+        if word in self.postings:
+            scored[word] = 1.0
+        return dict(heapq.nlargest(MAX_TERMS_PER_WORD, scored.items(), key=lambda item: item[1]))
+
+    def ingredient_matches(self, query):
+        """
+        Indexes of the cocktails using an ingredient whose canonical name
+        contains the query (or its canonical form), in catalog order.
+        """
+        query = remove_diacritics(query).lower().strip()
+        if not query:
+            return []
+        canonical = canonicalize(query)
+        matches = set()
+        for ingredient, indexes in self.used_by.items():
+            if query in ingredient or canonical in ingredient:
+                matches.update(indexes)
+        return sorted(matches)
+
+    def search(self, query, limit=50):
+        """
+        Returns [(cocktail index, score), ...] best first. Every query word has
+        to match something in a cocktail's name or ingredients. A query that
+        finds nothing is retried in canonical ingredient form ("lime juice" -> "lime").
+        """
+        results = self._search(words(query), limit)
+        if not results:
+            canonical_words = words(canonicalize(query))
+            if canonical_words != words(query):
+                results = self._search(canonical_words, limit)
+        return results
+
+    def _candidates(self, terms, cap):
+        """{cocktail index: best score} from the first `cap` postings of every matched term."""
+        best = {}
+        for term, similarity in terms.items():
+            for i, weight in islice(self.postings[term].items(), cap):
+                score = similarity * weight
+                if score > best.get(i, 0):
+                    best[i] = score
+        return best
+
+    def _score_word(self, candidates, terms):
+        """{candidate: best score for one query word}, only the candidates the word matches."""
+        best = {}
+        for term, similarity in terms.items():
+            docs = self.postings[term]
+            if len(docs) < len(candidates):
+                hits = ((i, weight) for i, weight in docs.items() if i in candidates)
+            else:
+                hits = ((i, docs[i]) for i in candidates if i in docs)
+            for i, weight in hits:
+                score = similarity * weight
+                if score > best.get(i, 0):
+                    best[i] = score
+        return best
+
+    def _search(self, query_words, limit):
+        if not query_words:
+            return []
+        matches = [self.term_matches(word) for word in query_words]
+        if not all(matches):
+            return []
+
+        cap = max(MAX_POSTINGS_PER_TERM, limit)
+        if len(matches) == 1:
+            return self._ranked(self._candidates(matches[0], cap), 1, limit)
+
+        # A result matches every word, so the postings of the rarest word hold all of them.
+        # When even those are too many, the candidates are the best postings of any word.
+        sizes = [sum(len(self.postings[term]) for term in terms) for terms in matches]
+        if min(sizes) <= MAX_CANDIDATES:
+            candidates = self._candidates(matches[sizes.index(min(sizes))], None).keys()
+        else:
+            candidates = set()
+            for terms in matches:
+                candidates.update(self._candidates(terms, cap))
+
+        totals = None
+        for terms in matches:
+            best = self._score_word(candidates, terms)
+            totals = best if totals is None else {i: totals[i] + score for i, score in best.items() if i in totals}
+            if not totals:
+                return []
+            candidates = totals.keys()
+        return self._ranked(totals, len(matches), limit)
+
+    def _ranked(self, totals, n, limit):
+        ranked = heapq.nsmallest(
+            limit, totals.items(),
+            key=lambda item: (-item[1], len(self.cocktails[item[0]]["name"]), item[0])
+        )
+        return [(i, total / n) for i, total in ranked]
@@ -0,0 +1,435 @@
+# sqlite_db.py
+import json
+import sqlite3
+import threading
+import uuid
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import MutableMapping, ValuesView, ItemsView
+from pathlib import Path
+
+from app_database.makeable_index import recipe_ingredients
+from utilities import canonicalize, remove_diacritics, synonyms_hash
+
+DEFAULT_DB_PATH = Path(__file__).with_name("whatcanimake.sqlite3")
+ROW_CACHE_SIZE = 2048  # decoded rows kept per table, the lists on screen are re-read a lot
+FETCH_SIZE = 1000  # rows per fetchmany() when streaming a whole table
+LOOKUP_SIZE = 500  # names per WHERE name IN (...) in get_many(), below SQLite's variable limit
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cocktails (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    name_key TEXT NOT NULL,  -- name_key(name), one cocktail per key
+    times_made INTEGER NOT NULL DEFAULT 0,  -- as written; counts made since then are in the event log
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS cocktails_name_key ON cocktails (name_key);
+CREATE TABLE IF NOT EXISTS cocktail_ingredients (
+    cocktail_id INTEGER NOT NULL REFERENCES cocktails (id) ON DELETE CASCADE,
+    ingredient TEXT NOT NULL,
+    PRIMARY KEY (cocktail_id, ingredient)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cocktail_ingredients_ingredient ON cocktail_ingredients (ingredient);
+CREATE TABLE IF NOT EXISTS inventory (
+    name TEXT PRIMARY KEY,
+    canonical TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS inventory_canonical ON inventory (canonical);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('cocktails_revision', '0'), ('inventory_revision', '0');
+"""
+
+# Every write bumps the table's revision, so a catalog version is one read instead of hashing every row
+REVISION_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS {table}_{event}_revision AFTER {event} ON {table}
+BEGIN
+    UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = '{table}_revision';
+END;
+"""
+
+# Changes to database files made by older versions, applied in order. PRAGMA user_version
+# counts the ones a file has; new files get SCHEMA as is and skip them all.
+MIGRATIONS = [
+    # The book filters by favorite/easy/flavor/prep method in memory, with the event log on
+    # top of the stored flags, so these columns were never read
+    """
+    DROP INDEX IF EXISTS cocktails_flavor;
+    DROP INDEX IF EXISTS cocktails_prep_method;
+    DROP INDEX IF EXISTS cocktails_favorite;
+    DROP INDEX IF EXISTS cocktails_easy;
+    ALTER TABLE cocktails DROP COLUMN search_name;
+    ALTER TABLE cocktails DROP COLUMN flavor_key;
+    ALTER TABLE cocktails DROP COLUMN prep_method;
+    ALTER TABLE cocktails DROP COLUMN is_favorite;
+    ALTER TABLE cocktails DROP COLUMN is_easy_to_make;
+    """,
+    # "NEGRONI" next to "Negroni": the first row of each folded name is kept, SCHEMA adds the unique index
+    """
+    ALTER TABLE cocktails ADD COLUMN name_key TEXT NOT NULL DEFAULT '';
+    UPDATE cocktails SET name_key = name_key(name);
+    DELETE FROM cocktails WHERE id NOT IN (SELECT MIN(id) FROM cocktails GROUP BY name_key);
+    """,
+]
+
+
+def name_key(name):
+    """The cocktail name without diacritics, case or extra whitespace."""
+    return remove_diacritics(" ".join(name.split())).lower()
+
+
+def connect(path=DEFAULT_DB_PATH):
+    """
+    Open (and create if needed) the app database in WAL mode, so the GUI can
+    read while a background import or index build is writing.
+    """
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.create_function("name_key", 1, name_key, deterministic=True)
+    with conn:
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'cocktails'").fetchone() is not None:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for script in MIGRATIONS[version:]:
+                conn.executescript(script)
+        conn.executescript(SCHEMA)
+        conn.execute(f"PRAGMA user_version = {len(MIGRATIONS)}")
+        for table in ("cocktails", "inventory"):
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                conn.execute(REVISION_TRIGGERS.format(table=table, event=event))
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('db_id', ?)", (uuid.uuid4().hex,))
+        found = conn.execute("SELECT value FROM meta WHERE key = 'synonyms_hash'").fetchone()
+        if found is None or found[0] != synonyms_hash():
+            recanonicalize(conn)
+    return conn
+
+
+def recanonicalize(conn):
+    """
+    Recompute the stored canonical ingredient names with the current synonyms
+    and bump both revisions, so snapshots keyed on them are rebuilt too.
+    Call inside a transaction.
+    """
+    conn.execute("DELETE FROM cocktail_ingredients")
+    cursor = conn.execute("SELECT id, data FROM cocktails")
+    while rows := cursor.fetchmany(FETCH_SIZE):
+        conn.executemany(
+            "INSERT INTO cocktail_ingredients (cocktail_id, ingredient) VALUES (?, ?)",
+            [(cocktail_id, ingredient) for cocktail_id, data in rows
+             for ingredient in recipe_ingredients(json.loads(data))],
+        )
+    conn.create_function("canonicalize", 1, canonicalize, deterministic=True)
+    conn.execute("UPDATE inventory SET canonical = canonicalize(name)")
+    conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 "
+                 "WHERE key IN ('cocktails_revision', 'inventory_revision')")
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('synonyms_hash', ?)", (synonyms_hash(),))
+
+
+class _RowValues(ValuesView):
+    def __iter__(self):
+        for _, value in self._mapping.stream():
+            yield value
+
+
+class _RowItems(ItemsView):
+    def __iter__(self):
+        yield from self._mapping.stream()
+
+
+class SQLiteTable(MutableMapping):
+    """
+    Dict-like view of a table: { name: row dict }, in insertion order.
+    Subclasses name the table and implement _write().
+
+    Rows are read on demand (with a small LRU of decoded rows) instead of
+    being loaded up front. Returned dicts are copies of the stored JSON, so
+    changes have to be written back with table[name] = row.
+
+    The connection is shared between the GUI thread and the workers, so every
+    use of it holds `lock`; long reads take it once per fetchmany() batch.
+    """
+
+    table = None
+
+    def __init__(self, conn, lock):
+        self.conn = conn
+        self.lock = lock  # serializes every use of the shared connection
+        self.row_hook = None  # row_hook(name, row) adjusts rows as they are decoded
+        self._rows = OrderedDict()
+        # The row LRU is used from the GUI thread and the workers. Its own lock, so a
+        # cache hit doesn't wait for a long query holding `lock` on another thread.
+        self._rows_lock = threading.Lock()
+
+    def __getitem__(self, name):
+        with self._rows_lock:
+            row = self._rows.get(name)
+            if row is not None:
+                self._rows.move_to_end(name)
+                return row
+        with self.lock:
+            found = self.conn.execute(f"SELECT data FROM {self.table} WHERE name = ?", (name,)).fetchone()
+        if found is None:
+            raise KeyError(name)
+        return self._remember(name, self._decode(name, found[0]))
+
+    def __setitem__(self, name, value):
+        with self.lock, self.conn:
+            self._write(name, value)
+        self._forget(name)
+
+    def __delitem__(self, name):
+        with self.lock, self.conn:
+            deleted = self.conn.execute(f"DELETE FROM {self.table} WHERE name = ?", (name,)).rowcount
+        self._forget(name)
+        if not deleted:
+            raise KeyError(name)
+
+    def __contains__(self, name):
+        with self._rows_lock:
+            if name in self._rows:
+                return True
+        with self.lock:
+            return self.conn.execute(f"SELECT 1 FROM {self.table} WHERE name = ?", (name,)).fetchone() is not None
+
+    def __iter__(self):
+        for (name,) in self._query(f"SELECT name FROM {self.table} ORDER BY rowid"):
+            yield name
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def values(self):
+        return _RowValues(self)
+
+    def items(self):
+        return _RowItems(self)
+
+    def stream(self, where="", params=()):
+        """Yield (name, row) for the rows matching a WHERE clause, one fetchmany() batch at a time."""
+        for name, data in self._query(f"SELECT name, data FROM {self.table} {where} ORDER BY rowid", params):
+            yield name, self._decode(name, data)
+
+    def get_many(self, names):
+        """The rows of `names` in that order, one query per LOOKUP_SIZE names instead of one per name."""
+        names = list(names)
+        found = {}
+        with self._rows_lock:
+            for name in names:
+                row = self._rows.get(name)
+                if row is not None:
+                    found[name] = row
+        missing = [name for name in names if name not in found]
+        for start in range(0, len(missing), LOOKUP_SIZE):
+            batch = missing[start:start + LOOKUP_SIZE]
+            marks = ", ".join("?" * len(batch))
+            with self.lock:
+                rows = self.conn.execute(
+                    f"SELECT name, data FROM {self.table} WHERE name IN ({marks})", batch
+                ).fetchall()
+            for name, data in rows:
+                found[name] = self._decode(name, data)
+        return [found[name] for name in names]
+
+    def write_many(self, items):
+        """Insert or replace many (name, row) pairs in one transaction."""
+        with self.lock, self.conn:
+            for name, value in items:
+                self._write(name, value)
+        with self._rows_lock:
+            self._rows.clear()
+
+    def revision(self):
+        with self.lock:
+            return int(self.conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (f"{self.table}_revision",)
+            ).fetchone()[0])
+
+    def _query(self, sql, params=()):
+        """Yield the rows of a query, holding the lock only while a batch is fetched."""
+        with self.lock:
+            cursor = self.conn.execute(sql, params)
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                return
+            yield from rows
+
+    def _decode(self, name, data):
+        row = json.loads(data)
+        return row if self.row_hook is None else self.row_hook(name, row)
+
+    def _remember(self, name, row):
+        with self._rows_lock:
+            self._rows[name] = row
+            if len(self._rows) > ROW_CACHE_SIZE:
+                self._rows.popitem(last=False)
+        return row
+
+    def _forget(self, name):
+        with self._rows_lock:
+            self._rows.pop(name, None)
+
+    @abstractmethod
+    def _write(self, name, value):
+        """Insert or replace one row. Called inside a transaction with the lock held."""
+
+
+class CocktailTable(SQLiteTable):
+    """
+    Names are unique up to name_key(): writing "NEGRONI" while "Negroni" is
+    stored raises sqlite3.IntegrityError, add_many() skips it.
+    """
+
+    table = "cocktails"
+
+    def add_many(self, rows):
+        """
+        Insert (name, row, ingredients) triples in one transaction, skipping the
+        names whose name_key() is stored already. ingredients are the canonical
+        names, recipe_ingredients(row) when None. Returns the number inserted.
+        """
+        inserted = 0
+        with self.lock, self.conn:
+            for name, cocktail, ingredients in rows:
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO cocktails (name, name_key, times_made, data) VALUES (?, ?, ?, ?)",
+                    self._columns(name, cocktail),
+                )
+                if cursor.rowcount:
+                    self._write_ingredients(cursor.lastrowid, cocktail, ingredients)
+                    inserted += 1
+        return inserted
+
+    def _write(self, name, cocktail):
+        self.conn.execute(
+            """
+            INSERT INTO cocktails (name, name_key, times_made, data) VALUES (?, ?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET times_made = excluded.times_made, data = excluded.data
+            """,
+            self._columns(name, cocktail),
+        )
+        cocktail_id = self.conn.execute("SELECT id FROM cocktails WHERE name = ?", (name,)).fetchone()[0]
+        self.conn.execute("DELETE FROM cocktail_ingredients WHERE cocktail_id = ?", (cocktail_id,))
+        self._write_ingredients(cocktail_id, cocktail)
+
+    @staticmethod
+    def _columns(name, cocktail):
+        if hasattr(cocktail, "to_dict"):
+            cocktail = cocktail.to_dict()
+        return name, name_key(name), cocktail.get("times_made", 0) or 0, json.dumps(cocktail, ensure_ascii=False)
+
+    def _write_ingredients(self, cocktail_id, cocktail, ingredients=None):
+        if ingredients is None:
+            ingredients = recipe_ingredients(cocktail)
+        self.conn.executemany(
+            "INSERT INTO cocktail_ingredients (cocktail_id, ingredient) VALUES (?, ?)",
+            [(cocktail_id, ingredient) for ingredient in ingredients],
+        )
+
+
+class InventoryTable(SQLiteTable):
+    table = "inventory"
+
+    def _write(self, name, item):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO inventory (name, canonical, data) VALUES (?, ?, ?)",
+            (name, canonicalize(name), json.dumps(item, ensure_ascii=False)),
+        )
+
+    def canonical_names(self):
+        with self.lock:
+            return {name for (name,) in self.conn.execute("SELECT DISTINCT canonical FROM inventory")}
+
+
+class _SQLiteDB:
+    table_class = None
+
+    def __init__(self, path=DEFAULT_DB_PATH, conn=None, lock=None):
+        self.path = path
+        self.conn = conn
+        self.lock = lock or threading.RLock()  # shared by every DB on the same connection
+        self.cache = {}
+
+    def load_cache(self):
+        """Open the database. Nothing is read yet, `cache` fetches rows on demand."""
+        if self.conn is None:
+            self.conn = connect(self.path)
+        self.cache = self.table_class(self.conn, self.lock)
+
+    def revision(self):
+        """Changes whenever the table does, stands in for hashing the whole cache."""
+        with self.lock:
+            db_id = self.conn.execute("SELECT value FROM meta WHERE key = 'db_id'").fetchone()[0]
+        return f"sqlite:{db_id}:{self.cache.table}:{self.cache.revision()}"
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class SQLiteInventoryDB(_SQLiteDB):
+    """Drop-in for InventoryDB backed by the inventory table."""
+
+    table_class = InventoryTable
+
+    def count_ingredients(self):
+        return len(self.cache)
+
+
+class SQLiteCocktailDB(_SQLiteDB):
+    """
+    Drop-in for CocktailDB backed by SQLite. The makeable set and the
+    counters are indexed queries instead of passes over a fully loaded
+    cache.
+    """
+
+    table_class = CocktailTable
+
+    def _stock_table(self, inventory_cache):
+        """Fill temp.stock with the canonical names in the inventory. Call with the lock held."""
+        if isinstance(inventory_cache, InventoryTable) and inventory_cache.conn is self.conn:
+            names = inventory_cache.canonical_names()
+        else:
+            names = {canonicalize(n) for n in inventory_cache if n and n.strip()}
+        with self.conn:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS stock (ingredient TEXT PRIMARY KEY) WITHOUT ROWID")
+            self.conn.execute("DELETE FROM temp.stock")
+            self.conn.executemany("INSERT OR IGNORE INTO temp.stock VALUES (?)", ((n,) for n in names))
+
+    _MAKEABLE = """
+        NOT EXISTS (
+            SELECT 1 FROM cocktail_ingredients ci
+            WHERE ci.cocktail_id = cocktails.id AND ci.ingredient NOT IN (SELECT ingredient FROM temp.stock)
+        )
+    """
+
+    def makeable_keys(self, inventory_cache):
+        with self.lock:  # temp.stock is per connection, keep other threads out until the query is read
+            self._stock_table(inventory_cache)
+            return [name for (name,) in self.conn.execute(
+                f"SELECT name FROM cocktails WHERE {self._MAKEABLE} ORDER BY id"
+            )]
+
+    def get_makeable_cocktails(self, inventory_cache):
+        with self.lock:
+            self._stock_table(inventory_cache)
+            return [row for _, row in self.cache.stream(f"WHERE {self._MAKEABLE}")]
+
+    def total_times_made(self):
+        with self.lock:
+            return self.conn.execute("SELECT COALESCE(SUM(times_made), 0) FROM cocktails").fetchone()[0]
+
+
+def open_databases(path=DEFAULT_DB_PATH):
+    """Inventory and cocktail DBs sharing one connection, so makeable queries can join the inventory."""
+    conn = connect(path)
+    lock = threading.RLock()
+    return SQLiteInventoryDB(path, conn, lock), SQLiteCocktailDB(path, conn, lock)
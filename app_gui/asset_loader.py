@@ -0,0 +1,159 @@
+# asset_loader.py
+from collections import OrderedDict
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Qt, QRect
+from PySide6.QtGui import QImage, QImageReader, QPainter, QPainterPath, QPixmap
+
+from app_gui.background import run_in_background
+from app_gui.profiling import profiler
+
+IMAGES_DIR = Path(__file__).with_name("images")
+CACHE_LIMIT_BYTES = 32 * 1024 * 1024  # decoded pixmaps kept around, ~130 screen-sized JPGs
+
+
+def image_path(name):
+    """Images named relative to app_gui/images, absolute paths are kept."""
+    path = Path(name)
+    return str(path if path.is_absolute() else IMAGES_DIR / path)
+
+
+def decode_image(path, size=None, crop=False, radius=0):
+    """
+    Decode an image file to a QImage, scaled to fit `size` (or to fill and
+    center-crop it when crop=True), with corners rounded by `radius`. Runs on
+    worker threads: QImage is safe there, QPixmap is not. JPEGs are
+    downscaled while decoding.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    if size is not None and reader.size().isValid():
+        mode = Qt.KeepAspectRatioByExpanding if crop else Qt.KeepAspectRatio
+        reader.setScaledSize(reader.size().scaled(size, mode))
+    image = reader.read()
+    if image.isNull():
+        raise OSError(f"Can't decode {path}: {reader.errorString()}")
+    if crop and size is not None:
+        x = (image.width() - size.width()) // 2
+        y = (image.height() - size.height()) // 2
+        image = image.copy(QRect(x, y, size.width(), size.height()))
+    if radius:
+        rounded = QImage(image.size(), QImage.Format_ARGB32_Premultiplied)
+        rounded.fill(Qt.transparent)
+        clip = QPainterPath()
+        clip.addRoundedRect(0, 0, image.width(), image.height(), radius, radius)
+        painter = QPainter(rounded)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setClipPath(clip)
+        painter.drawImage(0, 0, image)
+        painter.end()
+        image = rounded
+    return image
+
+
+class PixmapCache:
+    """LRU of pre-scaled pixmaps bounded by their decoded size in bytes."""
+
+    def __init__(self, limit_bytes=CACHE_LIMIT_BYTES):
+        self.limit_bytes = limit_bytes
+        self.used_bytes = 0
+        self._pixmaps = OrderedDict()
+
+    @staticmethod
+    def cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def get(self, key):
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def insert(self, key, pixmap):
+        if key in self._pixmaps:
+            self.used_bytes -= self.cost(self._pixmaps.pop(key))
+        self._pixmaps[key] = pixmap
+        self.used_bytes += self.cost(pixmap)
+        while self.used_bytes > self.limit_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self.used_bytes -= self.cost(evicted)
+
+
+class AssetLoader(QObject):
+    """
+    Loads images off the GUI thread. request() hands back a cached pixmap
+    right away, otherwise decodes it on the thread pool and calls back on
+    the GUI thread. Requests for the same image and size share one decode.
+    """
+
+    def __init__(self, cache_limit=CACHE_LIMIT_BYTES, parent=None):
+        super().__init__(parent)
+        self.cache = PixmapCache(cache_limit)
+        self._pending = {}  # key -> callbacks waiting for the decode
+        self._failed = set()  # keys that didn't decode, not retried on every paint
+        self._workers = {}
+
+    @staticmethod
+    def _key(path, size, crop, radius):
+        return path, (size.width(), size.height()) if size is not None else None, crop, radius
+
+    def cached(self, name, size=None, crop=False, radius=0):
+        """The pixmap if it is in the cache, None otherwise. Never starts a decode."""
+        return self.cache.get(self._key(image_path(name), size, crop, radius))
+
+    def request(self, name, size=None, callback=None, crop=False, radius=0):
+        """
+        The pixmap for an image (see image_path and decode_image), or None while
+        it is loading. callback(pixmap) is called once it is ready, also when
+        it was cached already. Asking again while it loads (a repaint) doesn't
+        register the same callback twice.
+        """
+        path = image_path(name)
+        key = self._key(path, size, crop, radius)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            if callback is not None:
+                callback(pixmap)
+            return pixmap
+        if key in self._failed:
+            return None
+
+        callbacks = self._pending.get(key)
+        if callbacks is None:
+            callbacks = self._pending[key] = []
+            self._workers[key] = run_in_background(
+                decode_image, path, size, crop, radius,
+                on_done=lambda image: self._on_decoded(key, image),
+                on_error=lambda error: self._on_failed(key, error),
+            )
+        if callback is not None and callback not in callbacks:
+            callbacks.append(callback)
+        return None
+
+    def prefetch(self, names, size=None):
+        for name in names:
+            self.request(name, size)
+
+    def _on_decoded(self, key, image):
+        pixmap = QPixmap.fromImage(image)
+        self.cache.insert(key, pixmap)
+        self._workers.pop(key, None)
+        for callback in self._pending.pop(key, ()):
+            callback(pixmap)
+
+    def _on_failed(self, key, error):
+        profiler().log_event("assets.decode_failed", path=key[0], error=error)  # the widget keeps its fallback
+        self._failed.add(key)
+        self._workers.pop(key, None)
+        self._pending.pop(key, None)
+
+
+_asset_loader = None
+
+
+def asset_loader():
+    """The app wide loader, created on first use (after the QApplication)."""
+    global _asset_loader
+    if _asset_loader is None:
+        _asset_loader = AssetLoader()
+    return _asset_loader
@@ -0,0 +1,126 @@
+# background.py
+import traceback
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class CancelToken:
+    """Set by whoever started a task once its result is no longer wanted."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class WorkerSignals(QObject):
+    """Signals live on the GUI thread, so connected slots run there."""
+    finished = Signal(object)
+    failed = Signal(str)
+    dropped = Signal()  # cancelled, neither finished nor failed is coming
+
+
+class Worker(QRunnable):
+    """
+    Runs fn(*args, **kwargs) on the thread pool and reports back by signal.
+    With a cancel_token, a task cancelled before it starts doesn't run and
+    one cancelled while running has its result dropped.
+    """
+
+    def __init__(self, fn, *args, cancel_token=None, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.cancel_token = cancel_token
+        self.signals = WorkerSignals()
+
+    def cancelled(self):
+        return self.cancel_token is not None and self.cancel_token.cancelled
+
+    def run(self):
+        if self.cancelled():
+            self.signals.dropped.emit()
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception:
+            if self.cancelled():
+                self.signals.dropped.emit()
+            else:
+                self.signals.failed.emit(traceback.format_exc())
+            return
+        if self.cancelled():
+            self.signals.dropped.emit()
+            return
+        self.signals.finished.emit(result)
+
+
+def run_in_background(fn, *args, on_done=None, on_error=None, cancel_token=None, **kwargs):
+    """
+    Start fn on the global QThreadPool. on_done gets the return value and
+    on_error the formatted traceback, both on the GUI thread.
+    """
+    worker = Worker(fn, *args, cancel_token=cancel_token, **kwargs)
+    if on_done is not None:
+        worker.signals.finished.connect(on_done)
+    if on_error is not None:
+        worker.signals.failed.connect(on_error)
+    QThreadPool.globalInstance().start(worker)
+    return worker
+
+
+class LatestTask(QObject):
+    """
+    A kind of computation where only the newest request matters (the book
+    filter, the bar suggestions). submit() cancels the previous request, and
+    finished/failed only ever carry the result of the latest one.
+
+    Tasks run one at a time on a private pool, so a task doesn't share the
+    data it reads with an older run of itself, and a superseded task that
+    didn't start yet never runs.
+    """
+
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._token = None
+        self._workers = set()  # keeps the Python side of the queued/running workers alive
+
+    @property
+    def busy(self):
+        return self._token is not None
+
+    def submit(self, fn, *args, **kwargs):
+        self.cancel()
+        token = self._token = CancelToken()
+        worker = Worker(fn, *args, cancel_token=token, **kwargs)
+        worker.setAutoDelete(False)  # freed with _workers, tryTake() may still look at a finished one
+        worker.signals.finished.connect(lambda result: self._deliver(worker, token, self.finished, result))
+        worker.signals.failed.connect(lambda error: self._deliver(worker, token, self.failed, error))
+        worker.signals.dropped.connect(lambda: self._workers.discard(worker))
+        self._workers.add(worker)
+        self.pool.start(worker)
+
+    def cancel(self):
+        """Drop the pending request, if any. Its result will not be delivered."""
+        if self._token is None:
+            return
+        self._token.cancel()
+        self._token = None
+        for worker in list(self._workers):
+            if self.pool.tryTake(worker):  # never started, no signal is coming
+                self._workers.discard(worker)
+
+    def _deliver(self, worker, token, signal, value):
+        self._workers.discard(worker)
+        # Cancelled after the worker emitted, the queued signal is still stale
+        if token is not self._token:
+            return
+        self._token = None
+        signal.emit(value)
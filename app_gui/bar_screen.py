@@ -1,18 +1,97 @@
 # bar_screen.py
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
-from PySide6.QtCore import QFile
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget
+
+from app_gui.background import LatestTask
+from app_gui.profiling import profiler
+
+ALMOST_MAKEABLE_LIMIT = 50  # rows shown in the "missing one or two" list
+SHOPPING_BUDGET = 3  # bottles in the suggested shopping plan
+
+
+def suggestions(makeable_index):
+    """Everything the bar screen shows: (best purchases, shopping plan, almost makeable)."""
+    return (
+        makeable_index.best_purchases(),
+        makeable_index.shopping_list(budget=SHOPPING_BUDGET),
+        makeable_index.almost_makeable(max_missing=2, limit=ALMOST_MAKEABLE_LIMIT),
+    )
 
 
 class BarScreen(QWidget):
-    """Replaces your Kivy BarScreen."""
+    """
+    Inventory screen: what to buy next and what could be made with one or two more bottles.
+    """
 
-    def __init__(self, inventory_db):
+    def __init__(self, inventory_db, makeable_store):
         super().__init__()
+        # Styled by the app wide theme. Set before the lists are created (with their parent),
+        # their scroll bars are polished right away
+        self.setObjectName("BarScreen")
         self.inventory_db = inventory_db
+        self.makeable_store = makeable_store
 
         layout = QVBoxLayout()
         layout.addWidget(QLabel("My Bar Inventory Screen"))
-        # You could list out the inventory here.
+
+        layout.addWidget(QLabel("Buy next"))
+        self.list_purchases = QListWidget(self)
+        layout.addWidget(self.list_purchases)
+        self.lbl_plan = QLabel()  # greedy plan for the next few bottles
+        self.lbl_plan.setWordWrap(True)
+        layout.addWidget(self.lbl_plan)
+
+        layout.addWidget(QLabel("One or two bottles away"))
+        self.list_almost = QListWidget(self)
+        layout.addWidget(self.list_almost)
         self.setLayout(layout)
 
+        # Suggestions are computed on a worker, a newer inventory change drops the older result
+        self.suggestions_task = LatestTask(self)
+        self.suggestions_task.finished.connect(self.show_suggestions)
+        self.suggestions_task.failed.connect(self.show_error)
+
+        self.makeable_store.changed.connect(self.refresh)
+        self.makeable_store.index_ready.connect(self.refresh)
+        self.makeable_store.index_failed.connect(self.show_error)
+        self.refresh()
+
+    def refresh(self, *_):
+        if not self.makeable_store.has_index():
+            # Building it here would freeze the window, the store builds it on a worker
+            self.suggestions_task.cancel()
+            self.show_message("Working out what to buy next...")
+            self.makeable_store.request_index()
+            return
+        self.suggestions_task.submit(suggestions, self.makeable_store.index())
+
+    def show_message(self, text):
+        """Replace the suggestions with one line of text (loading, errors)."""
+        self.list_purchases.clear()
+        self.list_purchases.addItem(text)
+        self.lbl_plan.setText("")
+        self.list_almost.clear()
+
+    def show_error(self, error):
+        profiler().log_event("bar.suggestions_failed", error=error)
+        self.show_message("Couldn't work out the suggestions.")
+
+    def show_suggestions(self, result):
+        purchases, plan, almost = result
+        cache = self.makeable_store.cocktail_cache
+
+        self.list_purchases.clear()
+        for ingredient, keys in purchases:
+            names = ", ".join(cache[key]["name"] for key in keys[:3])
+            more = f" +{len(keys) - 3} more" if len(keys) > 3 else ""
+            self.list_purchases.addItem(f"{ingredient}: unlocks {len(keys)} ({names}{more})")
+        if not self.list_purchases.count():
+            self.list_purchases.addItem("Nothing to buy, a single bottle won't unlock anything new.")
+
+        steps = [f"{ingredient} (+{len(keys)})" for ingredient, keys in plan]
+        self.lbl_plan.setText(f"Best {SHOPPING_BUDGET} bottles: {' -> '.join(steps)}" if steps else "")
+
+        self.list_almost.clear()
+        for key, missing in almost:
+            self.list_almost.addItem(f"{cache[key]['name']} - missing {', '.join(sorted(missing))}")
+        if not self.list_almost.count():
+            self.list_almost.addItem("No cocktails found.")
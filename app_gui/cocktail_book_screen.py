@@ -1,17 +1,50 @@
 # cocktail_book_screen.py
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QListWidget, QListWidgetItem, QDialog, \
-    QLineEdit, QHBoxLayout, QAbstractItemView, QComboBox
-from PySide6.QtCore import QFile, Signal, Qt
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtGui import QIcon, QFont
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QListView, QDialog, \
+    QLineEdit, QAbstractItemView, QComboBox
+from PySide6.QtCore import Signal, QTimer
+
+from app_database.cocktail_filter import CocktailFilterIndex
+from app_gui.background import LatestTask
+from app_gui.cocktail_list_view import CocktailListModel, CocktailItemDelegate
+from app_gui.profiling import profiler
+from app_gui.theme import set_state
+from app_gui.ui_forms import load_form
+
+SEARCH_DEBOUNCE_MS = 150  # wait for a pause in typing before filtering
+BACKGROUND_FILTER_MIN = 5000  # smaller books filter faster than a round trip to a worker thread
 
 
 class CocktailDetailDialog(QDialog):
+    made = Signal()
+    favorite_toggled = Signal(bool)
+
     def __init__(self, cocktail):
         super().__init__()
+        self.cocktail = cocktail
+        self.setObjectName("CocktailDetail")
         self.setWindowTitle(cocktail["name"])
         layout = QVBoxLayout(self)
 
+        self.lbl_details = QLabel()
+        self.lbl_details.setWordWrap(True)
+        layout.addWidget(self.lbl_details)
+        self.update_details()
+
+        self.btn_made = QPushButton("I made this")
+        self.btn_made.clicked.connect(self.made.emit)
+        layout.addWidget(self.btn_made)
+        self.btn_favorite = QPushButton("Favorite")
+        self.btn_favorite.clicked.connect(self.toggle_favorite)
+        layout.addWidget(self.btn_favorite)
+        set_state(self.btn_favorite, "favorite", bool(cocktail.get("is_favorite", False)))
+
+    def toggle_favorite(self):
+        favorite = not self.btn_favorite.property("favorite")
+        set_state(self.btn_favorite, "favorite", favorite)  # the theme colors [favorite="true"]
+        self.favorite_toggled.emit(favorite)
+
+    def update_details(self):
+        cocktail = self.cocktail
         details = f"""
         Name: {cocktail["name"]}
         ABV: {cocktail.get("abv", "Unknown")}
@@ -25,31 +58,37 @@ class CocktailDetailDialog(QDialog):
         Instructions:
         {cocktail.get('instructions', 'No instructions available.')}
         """
-        lbl_details = QLabel(details)
-        lbl_details.setWordWrap(True)
-        layout.addWidget(lbl_details)
+        self.lbl_details.setText(details)
 
 
 class CocktailBookScreen(QWidget):
     back_to_main = Signal()
+    times_made_changed = Signal(int)  # new total of drinks made
 
-    def __init__(self, inventory_db, cocktail_db):
+    def __init__(self, inventory_db, cocktail_db, makeable_store, event_log):
         super().__init__()
+        self.setObjectName("CocktailBook")  # styled by the app wide theme
         self.inventory_db = inventory_db
         self.cocktail_db = cocktail_db
-        self.all_cocktails = self.cocktail_db.get_makeable_cocktails(self.inventory_db.cache)
+        self.makeable_store = makeable_store
+        self.event_log = event_log
+        self.set_cocktails(makeable_store.makeable_cocktails())
 
         self.search_text = ""
         self.show_favorites = False
         self.show_easy = False
         self.show_stirred = False
+        self.filtered_indexes = []
+        self.filtered = []
+        self._refresh_phases = None
+
+        # Filtering big books runs on a worker, a newer refresh drops the older result
+        self.filter_task = LatestTask(self)
+        self.filter_task.finished.connect(self.show_filtered)
+        self.filter_task.failed.connect(self.show_filter_error)
 
-        # 1. Load .ui
-        loader = QUiLoader()
-        ui_file = QFile("app_gui/cocktail_book_screen.ui")
-        ui_file.open(QFile.ReadOnly)
-        self.ui = loader.load(ui_file, self)
-        ui_file.close()
+        # 1. Load the form (compiled from cocktail_book_screen.ui)
+        self.ui = load_form("cocktail_book_screen", self)
 
         # 2. Set layout - maybe to hide this question mark
         self.setLayout(QVBoxLayout())
@@ -62,18 +101,26 @@ class CocktailBookScreen(QWidget):
         self.btn_favorites = self.ui.findChild(QPushButton, "btn_favorites")
         self.btn_easy = self.ui.findChild(QPushButton, "btn_easy")
         self.btn_stirred = self.ui.findChild(QPushButton, "btn_stirred")
-        self.list_cocktails = self.ui.findChild(QListWidget, "list_cocktails")
+        self.list_cocktails = self.ui.findChild(QListView, "list_cocktails")
         self.combo_flavor = self.ui.findChild(QComboBox, "combo_flavor") # the drop down menu
 
-        print([btn.objectName() for btn in self.ui.findChildren(QPushButton)])
-
         # 4. Connect signals
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.refresh_cocktail_list)
         self.name_search.textChanged.connect(self.handle_search)
         self.btn_favorites.clicked.connect(self.toggle_favorites)
         self.btn_easy.clicked.connect(self.toggle_easy)
         self.btn_stirred.clicked.connect(self.toggle_stirred)
 
-        self.list_cocktails.itemClicked.connect(self.show_cocktail_details)
+        # Model/view list: rows are painted by the delegate, only the visible ones cost anything
+        self.cocktail_model = CocktailListModel(self)
+        self.list_cocktails.setModel(self.cocktail_model)
+        self.list_cocktails.setItemDelegate(CocktailItemDelegate(self.list_cocktails))
+        self.list_cocktails.setUniformItemSizes(True)
+        self.list_cocktails.setMouseTracking(True)  # hover highlight
+        self.list_cocktails.clicked.connect(self.show_cocktail_details)
 
         #load the drop down with flavors
         self.combo_flavor.addItem("All")
@@ -84,237 +131,87 @@ class CocktailBookScreen(QWidget):
         self.list_cocktails.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.list_cocktails.verticalScrollBar().setSingleStep(9)
 
+        self.makeable_store.changed.connect(self.on_makeable_changed)
+
         # 5. Initialize
-        self.apply_style()  # optional
         self.refresh_cocktail_list()
 
-    def show_cocktail_details(self, item):
-        row = self.list_cocktails.row(item)
-        cocktail = self.filtered[row]  # Use the current filtered list
-        # Now open a detail dialog (you'll need to implement CocktailDetailDialog)
+    def show_cocktail_details(self, index):
+        cocktail = self.cocktail_model.cocktail(index.row())  # the book's own row, changes must land there
+        if cocktail is None:  # the "No cocktails found." row
+            return
+        position = self.filtered_indexes[index.row()]
         dialog = CocktailDetailDialog(cocktail)
+        dialog.made.connect(lambda: self.record_made(cocktail, dialog))
+        dialog.favorite_toggled.connect(lambda value: self.set_favorite(position, value))
         dialog.exec()
 
-    def apply_style(self):
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-            background-color: #1f1f1f;
-            color: #ffffff;
-        }
-
-        QWidget#MainContainer {
-            background-color: #1f1f1f;
-        }
-
-        QWidget#TitleBar {
-            background-color: #1a1a1a;
-        }
-
-        QLineEdit {
-            background-color: #333333;
-            border: 1px solid #444444;
-            border-radius: 6px;
-            padding: 6px;
-        }
-
-        QListWidget {
-            background-color: #2c2c2c;
-            border: none;
-        }
-
-        QListWidget::item {
-            background-color: #2c2c2c;
-            margin-top: 3px;
-            margin-bottom: 2px;
-            margin-left: 3px;
-            margin-right: 3px;
-            border-radius: 5px;
-        }
-
-        QPushButton {
-            background-color: #444444;
-            border: none;
-            padding: 8px 12px;
-            margin: 4px;
-            border-radius: 6px;
-        }
-
-        QPushButton:hover {
-            background-color: #555555;
-        }
-
-        QPushButton:checked {
-            background-color: #ff4444;
-        }
-
-        QPushButton#CloseButton:hover {
-            background-color: #ff4444;
-        }
-
-        QLabel {
-            color: white;
-        }
-        
-        QScrollBar:vertical {
-            border: none;
-            background: #1e1e1e;
-            width: 12px;
-            margin: 0px 0px 0px 0px;
-            border-radius: 6px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background: #44475a;
-            min-height: 20px;
-            border-radius: 6px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background: #6272a4;
-        }
-        
-        QScrollBar::add-line:vertical,
-        QScrollBar::sub-line:vertical {
-            height: 0;
-            background: none;
-        }
-        
-        QScrollBar::add-page:vertical,
-        QScrollBar::sub-page:vertical {
-            background: none;
-        }
-        
-        QComboBox {
-            background-color: #444444;
-            border: none;
-            padding: 8px 12px;
-            margin: 4px;
-            border-radius: 6px;
-            color: white;
-        }
-        
-        QComboBox:hover {
-            background-color: #555555;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            background: transparent;
-        }
-
-        
-        """)
+    def record_made(self, cocktail, dialog):
+        total = self.event_log.record_made(cocktail["name"], cocktail)
+        dialog.update_details()
+        self.times_made_changed.emit(total)
+
+    def set_favorite(self, position, value):
+        cocktail = self.all_cocktails[position]
+        self.event_log.set_favorite(cocktail["name"], value, cocktail)
+        self.filter_index.set_favorite(position, value)
+        self.refresh_cocktail_list()  # repaint the heart, and drop the row if only favorites are shown
+
+    def set_cocktails(self, cocktails):
+        """
+        Replace the cocktails the book shows. Search names and filter index
+        sets are built once here, not on every keystroke or toggle, and cached
+        filter results live as long as the catalog version they belong to.
+        """
+        if cocktails is getattr(self, "all_cocktails", None):
+            return
+        self.all_cocktails = cocktails
+        self.filter_index = CocktailFilterIndex(cocktails, version=self.makeable_store.version)
+
+    def on_makeable_changed(self, added, removed):
+        self.set_cocktails(self.makeable_store.makeable_cocktails())
+        self.refresh_cocktail_list()
 
     def refresh_cocktail_list(self):
-        self.list_cocktails.clear()
-        self.filtered = self.all_cocktails  # 1) Start with all cocktails
-
-        if self.search_text:  # 2) Apply search filter
-            self.filtered = [
-                c for c in self.filtered
-                if self.search_text.lower() in c["name"].lower()
-            ]
-
-        if self.show_favorites:  # 3) Apply toggles
-            self.filtered = [
-                c for c in self.filtered
-                if c.get("is_favorite", False)
-            ]
-
-        if self.show_stirred:
-            self.filtered = [
-                c for c in self.filtered
-                if (c.get("prep_method") or "") == "Stirred"
-            ]
-
-        if self.show_easy:
-            # or c['is_easy_to_make'] if that’s your DB property
-            self.filtered = [
-                c for c in self.filtered
-                if c.get("is_easy_to_make", False)
-            ]
-
-        selected_flavor = self.combo_flavor.currentText()
-
-        if selected_flavor.lower() != "all":
-            selected = selected_flavor.strip().lower()
-            self.filtered = [
-                c for c in self.filtered
-                if selected in c.get("flavor", "").strip().lower()
-            ]
-
-        if not self.filtered:  # 4) Show final results
-            item = QListWidgetItem("No cocktails found.")
-            self.list_cocktails.addItem(item)
+        self.search_timer.stop()  # a pending search is applied now
+        self._refresh_phases = profiler().phases("book.refresh")  # filter vs model update time with --profile
+        criteria = dict(
+            search_text=self.search_text,
+            favorites=self.show_favorites,
+            easy=self.show_easy,
+            stirred=self.show_stirred,
+            flavor=self.combo_flavor.currentText(),
+        )
+        # The whole book is nothing to compute ("" is the flavor placeholder)
+        unfiltered = criteria["flavor"] in ("", "All") and not (
+            self.search_text or self.show_favorites or self.show_easy or self.show_stirred
+        )
+        if unfiltered or len(self.all_cocktails) < BACKGROUND_FILTER_MIN:
+            self.filter_task.cancel()  # an older background result must not land after this one
+            self.show_filtered(self.filter_index.filter(**criteria))
         else:
-            for cocktail in self.filtered:
-                item_widget = self.create_cocktail_widget(cocktail)
-                item = QListWidgetItem()
-                item.setSizeHint(item_widget.sizeHint())
-                self.list_cocktails.addItem(item)
-                self.list_cocktails.setItemWidget(item, item_widget)
-
-    def create_cocktail_widget(self, cocktail):
-        outer = QWidget()
-        outer_layout = QVBoxLayout(outer)
-        outer_layout.setContentsMargins(0, 0, 0, 15)  # 10px bottom margin
-        outer_layout.setSpacing(0)
-
-        inner = QWidget()
-        layout = QHBoxLayout(inner)
-        layout.setContentsMargins(5, 5, 5, 5)
-
-        # Circle with initial
-        circle_label = QLabel(cocktail["name"][0].upper())
-        circle_label.setFixedSize(40, 40)
-        circle_label.setAlignment(Qt.AlignCenter)
-        circle_label.setStyleSheet("""
-            QLabel {
-                background-color: #6272a4;
-                border-radius: 20px;
-                color: #f8f8f2;
-                font-weight: bold;
-                font-size: 18px;
-            }
-        """)
-
-        # Cocktail name and ingredients vertical layout
-        text_layout = QVBoxLayout()
-        name_layout = QHBoxLayout()
-
-        # Cocktail Name
-        lbl_name = QLabel(cocktail["name"])
-        lbl_name.setFont(QFont("Segoe UI", 12, QFont.Bold))
-
-        name_layout.addWidget(lbl_name)
-
-        # Favorite Icon
-        if cocktail.get("is_favorite"):
-            heart_icon = QLabel("❤")
-            heart_icon.setStyleSheet("color: #ff5555; font-size: 16px;")
-            name_layout.addWidget(heart_icon)
-
-        name_layout.addStretch()
-
-        # Ingredients (made_from)
-        ingredients = (cocktail.get("made_from"))
-        lbl_ingredients = QLabel(ingredients)
-        lbl_ingredients.setFont(QFont("Segoe UI", 10))
-        lbl_ingredients.setStyleSheet("color: #bbbbbb;")
-
-        text_layout.addLayout(name_layout)
-        text_layout.addWidget(lbl_ingredients)
-
-        layout.addWidget(circle_label)
-        layout.addLayout(text_layout)
-        inner.setLayout(layout)
-
-        outer_layout.addWidget(inner)
-        return outer
+            self.filter_task.submit(self.filter_index.filter, **criteria)
+
+    def show_filtered(self, indexes):
+        """Show the result of the latest refresh_cocktail_list."""
+        phases = self._refresh_phases
+        phases.mark("filter")
+        self.filtered_indexes = indexes
+        self.filtered = [self.all_cocktails[i] for i in indexes]
+
+        self.cocktail_model.set_cocktails(self.filtered)  # Show final results
+        phases.mark("build")
+        phases.done()
+
+    def show_filter_error(self, error):
+        profiler().log_event("book.filter_failed", error=error)
+        self.filtered_indexes = []
+        self.filtered = []
+        self.cocktail_model.set_cocktails([], "Filtering failed, try another search.")
 
     def handle_search(self, txt):
         self.search_text = txt  # remember it
-        self.refresh_cocktail_list()
+        self.search_timer.start()  # restarts the debounce on every keystroke
 
     def toggle_favorites(self):
         self.show_favorites = self.btn_favorites.isChecked()
@@ -0,0 +1,164 @@
+# cocktail_list_view.py
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+
+from app_gui.asset_loader import asset_loader
+from app_gui.theme import PALETTE
+
+
+class CocktailListModel(QAbstractListModel):
+    """
+    Read-only model over a list of cocktail dicts. The view only asks for the
+    rows it shows, so no per-cocktail widget is ever created. The delegate and
+    the book read the dicts through cocktail(row): a dict passed through a Qt
+    role comes back as a converted copy.
+    """
+
+    EMPTY_TEXT = "No cocktails found."
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cocktails = []
+        self.empty_text = self.EMPTY_TEXT
+
+    def set_cocktails(self, cocktails, empty_text=EMPTY_TEXT):
+        """Show a list of cocktails, or empty_text in a placeholder row if it is empty."""
+        self.beginResetModel()
+        self.cocktails = cocktails
+        self.empty_text = empty_text
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.cocktails) or 1  # one placeholder row when empty
+
+    def cocktail(self, row):
+        """The cocktail dict shown in a row, None for the placeholder row."""
+        return self.cocktails[row] if self.cocktails else None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cocktail = self.cocktail(index.row())
+        if role == Qt.DisplayRole:
+            return cocktail["name"] if cocktail else self.empty_text
+        return None
+
+
+class CocktailItemDelegate(QStyledItemDelegate):
+    """
+    Paints a cocktail row: initial circle (or the cocktail's "image" as a round
+    thumbnail), name, heart for favorites and the made_from line. Thumbnails
+    are decoded in the background, the row shows the initial until then.
+    """
+
+    PADDING = 5
+    CIRCLE_SIZE = 40
+    ROW_GAP = 15  # space under each row
+
+    # Rows are painted, not styled: colors come straight from the theme tokens
+    ROW_COLOR = QColor(PALETTE["surface"])
+    ROW_HOVER_COLOR = QColor(PALETTE["surface_hover"])
+    CIRCLE_COLOR = QColor(PALETTE["chrome_highlight"])
+    CIRCLE_TEXT_COLOR = QColor(PALETTE["chrome_text"])
+    NAME_COLOR = QColor(PALETTE["text"])
+    HEART_COLOR = QColor(PALETTE["heart"])
+    INGREDIENTS_COLOR = QColor(PALETTE["text_muted"])
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.initial_font = QFont("Segoe UI")
+        self.initial_font.setPixelSize(18)
+        self.initial_font.setBold(True)
+        self.name_font = QFont("Segoe UI", 12, QFont.Bold)
+        self.heart_font = QFont("Segoe UI")
+        self.heart_font.setPixelSize(16)
+        self.ingredients_font = QFont("Segoe UI", 10)
+
+        self.name_metrics = QFontMetrics(self.name_font)
+        self.ingredients_metrics = QFontMetrics(self.ingredients_font)
+        text_height = self.name_metrics.height() + self.ingredients_metrics.height() + 4
+        self.row_height = 2 * self.PADDING + max(self.CIRCLE_SIZE, text_height)
+        self.thumbnail_size = QSize(self.CIRCLE_SIZE, self.CIRCLE_SIZE)
+        self.assets = asset_loader()
+
+    def thumbnail(self, cocktail):
+        """The cached round thumbnail, or None (and a background load is started)."""
+        image = cocktail.get("image")
+        if not image:
+            return None
+        args = (image, self.thumbnail_size, True, self.CIRCLE_SIZE // 2)
+        pixmap = self.assets.cached(*args)
+        if pixmap is None:
+            self.assets.request(image, self.thumbnail_size, self._thumbnail_ready, crop=True, radius=args[3])
+        return pixmap
+
+    def _thumbnail_ready(self, pixmap):
+        view = self.parent()
+        if view is not None:
+            view.viewport().update()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), 3 + self.row_height + 2 + self.ROW_GAP)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = QRect(option.rect.left() + 3, option.rect.top() + 3, option.rect.width() - 6, self.row_height)
+        hovered = option.state & QStyle.State_MouseOver
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.ROW_HOVER_COLOR if hovered else self.ROW_COLOR)
+        painter.drawRoundedRect(rect, 5, 5)
+
+        cocktail = index.model().cocktail(index.row())
+        if cocktail is None:
+            painter.setPen(self.NAME_COLOR)
+            painter.setFont(self.ingredients_font)
+            painter.drawText(rect.adjusted(10, 0, -10, 0), Qt.AlignLeft | Qt.AlignVCenter, index.data())
+            painter.restore()
+            return
+
+        # Thumbnail, or circle with initial
+        top = rect.top() + (rect.height() - self.CIRCLE_SIZE) // 2
+        circle = QRect(rect.left() + self.PADDING, top, self.CIRCLE_SIZE, self.CIRCLE_SIZE)
+        thumbnail = self.thumbnail(cocktail)
+        if thumbnail is not None:
+            painter.drawPixmap(circle, thumbnail)
+        else:
+            painter.setBrush(self.CIRCLE_COLOR)
+            painter.drawEllipse(circle)
+            painter.setFont(self.initial_font)
+            painter.setPen(self.CIRCLE_TEXT_COLOR)
+            painter.drawText(circle, Qt.AlignCenter, cocktail["name"][:1].upper())
+
+        # Cocktail name (+ heart if favorite)
+        x = circle.right() + 10
+        width = rect.right() - self.PADDING - x
+        heart_width = 24 if cocktail.get("is_favorite") else 0
+        name_top = rect.top() + (rect.height() - self.name_metrics.height() - 4 - self.ingredients_metrics.height()) // 2
+        name = self.name_metrics.elidedText(cocktail["name"], Qt.ElideRight, max(0, width - heart_width))
+        painter.setFont(self.name_font)
+        painter.setPen(self.NAME_COLOR)
+        painter.drawText(QRect(x, name_top, width, self.name_metrics.height()), Qt.AlignLeft | Qt.AlignVCenter, name)
+
+        if heart_width:
+            heart_x = x + self.name_metrics.horizontalAdvance(name) + 6
+            painter.setFont(self.heart_font)
+            painter.setPen(self.HEART_COLOR)
+            painter.drawText(QRect(heart_x, name_top, heart_width, self.name_metrics.height()),
+                             Qt.AlignLeft | Qt.AlignVCenter, "❤")
+
+        # Ingredients (made_from)
+        made_from = cocktail.get("made_from") or ""
+        if made_from:
+            ingredients_top = name_top + self.name_metrics.height() + 4
+            made_from = self.ingredients_metrics.elidedText(made_from, Qt.ElideRight, width)
+            painter.setFont(self.ingredients_font)
+            painter.setPen(self.INGREDIENTS_COLOR)
+            painter.drawText(QRect(x, ingredients_top, width, self.ingredients_metrics.height()),
+                             Qt.AlignLeft | Qt.AlignVCenter, made_from)
+
+        painter.restore()
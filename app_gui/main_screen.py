@@ -1,72 +1,71 @@
 # main_screen.py
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
-from PySide6.QtCore import QFile, Signal, QSize
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtCore import Signal, QSize
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import Qt
 
+from app_gui.asset_loader import asset_loader
+from app_gui.ui_forms import load_form
+
 
 class MainScreen(QWidget):
     # Signal to tell MainWindow to switch screens
     open_cocktail_book = Signal()
+    open_bar = Signal()
 
-    def __init__(self, inventory_db, cocktail_db):
+    def __init__(self, makeable_store, snapshot=None):
         super().__init__()
-        self.inventory_db = inventory_db
-        self.cocktail_db = cocktail_db
-
-        # Load the .ui file
+        self.makeable_store = makeable_store
+        self.makeable_store.changed.connect(self.on_makeable_changed)
 
-        loader = QUiLoader()
-        ui_file = QFile("app_gui/main_screen.ui")
-        ui_file.open(QFile.ReadOnly)
-        self.ui = loader.load(ui_file, self)
-        ui_file.close()
+        # Load the form (compiled from main_screen.ui)
+        self.ui = load_form("main_screen", self)
 
-        # set size and name
+        # set size and name (the theme styles #MainScreen)
         self.setMinimumSize(640, 530)
-        self.setStyleSheet("""
-            background-color: #000000;
-            color: #ffffff;
-        """)
+        self.setObjectName("MainScreen")
 
         # Button: connect signal
         self.btnMake = self.ui.findChild(QPushButton, "btnMake")  # IOT open cocktail book
-        self.btnMake.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background-image: url(app_gui/images/book_icon.png);
-                background-repeat: no-repeat;
-                background-position: center;
-                background-origin: content;
-            }
-        """)
 
-        self.btnMake.setIcon(QIcon("app_gui/images/book.png"))
+        # The book picture is a label under the button, decoded off the GUI thread
+        # instead of through a stylesheet url()
+        self.btnMake_image = QLabel(self.btnMake.parentWidget())
+        self.btnMake_image.setGeometry(self.btnMake.geometry())
+        self.btnMake_image.setAlignment(Qt.AlignCenter)
+        self.btnMake_image.stackUnder(self.btnMake)
+        assets = asset_loader()
+        assets.request("book_icon.png", self.btnMake.size(), self.btnMake_image.setPixmap, radius=10)
+        assets.request("book.png", self.btnMake.iconSize(), lambda pixmap: self.btnMake.setIcon(QIcon(pixmap)))
         self.btnMake.clicked.connect(self.open_cocktail_book.emit)
+        self.btnBar = self.ui.findChild(QPushButton, "btnBar")
+        self.btnBar.clicked.connect(self.open_bar.emit)
 
         # Layout
         layout = QVBoxLayout()
         layout.addWidget(self.ui)
         self.setLayout(layout)
 
-        makeable_cocktails = self.cocktail_db.get_makeable_cocktails(self.inventory_db.cache)
-
-        lbl = self.ui.findChild(QLabel, "lbl_num_can_make")
-        lbl.setText(f"{len(makeable_cocktails)}")
-        #lbl.setAlignment(Qt.AlignCenter)
-
-        lbl = self.ui.findChild(QLabel, "lbl_num_enjoyed")  # the line under work bc use the cache in main
-        cocktails_made_so_far = sum(c.get("times_made", 0) for c in self.cocktail_db.cache.values())
-        lbl.setText(f"{cocktails_made_so_far}")
-        #lbl.setAlignment(Qt.AlignCenter)
-
-        lbl = self.ui.findChild(QLabel, "lbl_num_total")
-        lbl.setText(f"{self.inventory_db.count_ingredients()}")
-        #lbl.setAlignment(Qt.AlignCenter)
-
-
-
-
-
-
+        self.lbl_num_can_make = self.ui.findChild(QLabel, "lbl_num_can_make")
+        self.lbl_num_enjoyed = self.ui.findChild(QLabel, "lbl_num_enjoyed")
+        self.lbl_num_total = self.ui.findChild(QLabel, "lbl_num_total")
+        self.set_snapshot(snapshot)
+
+    def set_snapshot(self, snapshot):
+        """
+        Fill the three counters from the snapshot MainWindow computed (or loaded
+        from disk). Shows placeholders while the databases are still loading.
+        """
+        if snapshot is None:
+            for lbl in (self.lbl_num_can_make, self.lbl_num_enjoyed, self.lbl_num_total):
+                lbl.setText("-")
+            return
+        self.lbl_num_can_make.setText(f"{len(snapshot['makeable'])}")
+        self.lbl_num_enjoyed.setText(f"{snapshot['times_made']}")
+        self.lbl_num_total.setText(f"{snapshot['ingredient_count']}")
+
+    def set_times_made(self, total):
+        self.lbl_num_enjoyed.setText(f"{total}")
+
+    def on_makeable_changed(self, added, removed):
+        self.lbl_num_can_make.setText(f"{self.makeable_store.count()}")
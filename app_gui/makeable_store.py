@@ -0,0 +1,115 @@
+# makeable_store.py
+from PySide6.QtCore import QObject, Signal
+
+from app_database.makeable_index import MakeableIndex
+from app_gui.background import run_in_background
+
+
+class MakeableStore(QObject):
+    """
+    The one makeable-cocktail set of the app, owned by MainWindow.
+
+    Computed once; inventory changes go through add_ingredient/remove_ingredient
+    (or sync_inventory) and screens subscribe to `changed` instead of
+    recomputing on their own.
+    """
+
+    # Keys of the cocktails that became makeable / stopped being makeable
+    changed = Signal(list, list)
+    index_ready = Signal()  # the index exists now, see request_index()
+    index_failed = Signal(str)  # building it in the background failed, with the traceback
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cocktail_cache = {}
+        self.inventory_cache = {}
+        self.makeable_index = None
+        self._snapshot_keys = []  # makeable keys from the startup snapshot, until the index exists
+        self._snapshot_cocktails = None
+        self.version = 0  # bumped whenever the makeable set (the book's catalog) may have changed
+        self._index_worker = None
+
+    def load(self, cocktail_cache, inventory_cache, makeable_keys, makeable_index=None, makeable_cocktails=None):
+        """
+        Fill the store after startup. On a warm start only the snapshot keys are
+        known, the index is handed over later through set_index().
+        makeable_cocktails are the rows of makeable_keys if the caller read them
+        already (the startup worker does on the SQLite store).
+        """
+        self.cocktail_cache = cocktail_cache
+        self.inventory_cache = inventory_cache
+        self.makeable_index = makeable_index
+        self._snapshot_keys = makeable_keys
+        self._snapshot_cocktails = makeable_cocktails
+        self.version += 1
+
+    def set_index(self, makeable_index):
+        """Take over an index built in the background, unless one was needed (and built) earlier."""
+        self._index_worker = None
+        if self.makeable_index is not None:
+            return
+        self.makeable_index = makeable_index
+        self.version += 1
+        before = set(self._snapshot_keys)
+        after = makeable_index.makeable
+        self._emit(list(after - before), list(before - after))
+        self.index_ready.emit()
+
+    def has_index(self):
+        return self.makeable_index is not None
+
+    def request_index(self):
+        """
+        Build the index on a worker unless it exists or is being built already.
+        It reads every recipe, so on the SQLite store it is only asked for by
+        the screens that need it.
+        """
+        if self.makeable_index is not None or self._index_worker is not None:
+            return
+        self._index_worker = run_in_background(
+            MakeableIndex, self.cocktail_cache, self.inventory_cache,
+            on_done=self.set_index, on_error=self._on_index_failed,
+        )
+
+    def _on_index_failed(self, error):
+        self._index_worker = None
+        self.index_failed.emit(error)
+
+    def index(self):
+        if self.makeable_index is None:
+            self.set_index(MakeableIndex(self.cocktail_cache, self.inventory_cache))
+        return self.makeable_index
+
+    def makeable_cocktails(self):
+        """Makeable cocktail dicts in recipe book order."""
+        if self.makeable_index is not None:
+            return self.makeable_index.get_makeable_cocktails()
+        if self._snapshot_cocktails is None:
+            if hasattr(self.cocktail_cache, "get_many"):  # SQLite table, read in batches
+                self._snapshot_cocktails = self.cocktail_cache.get_many(self._snapshot_keys)
+            else:
+                self._snapshot_cocktails = [self.cocktail_cache[key] for key in self._snapshot_keys]
+        return self._snapshot_cocktails
+
+    def count(self):
+        if self.makeable_index is not None:
+            return len(self.makeable_index.makeable)
+        return len(self._snapshot_keys)
+
+    def add_ingredient(self, ingredient):
+        self._emit(self.index().add_ingredient(ingredient), [])
+
+    def remove_ingredient(self, ingredient):
+        self._emit([], self.index().remove_ingredient(ingredient))
+
+    def sync_inventory(self, inventory_cache=None):
+        """Catch up with changes made to the inventory cache outside the store."""
+        if inventory_cache is not None:
+            self.inventory_cache = inventory_cache
+        added, removed = self.index().sync_inventory(self.inventory_cache)
+        self._emit(added, removed)
+
+    def _emit(self, added, removed):
+        if added or removed:
+            self.version += 1
+            self.changed.emit(added, removed)
@@ -0,0 +1,196 @@
+# profiling.py
+"""
+Opt-in GUI latency instrumentation.
+
+Enabled with WHATCANIMAKE_PROFILE=1 or `python main.py --profile`. Timings go
+to a JSON lines log (WHATCANIMAKE_PROFILE_LOG, default profile_log.jsonl next
+to main.py) and to an overlay toggled with F12. When disabled every hook is
+a cheap no-op.
+"""
+import json
+import os
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from PySide6.QtCore import QObject, QElapsedTimer, QTimer, Qt, Signal
+from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtWidgets import QLabel
+
+from utilities import APP_DIR
+
+STALL_MS = 16  # one frame at 60 Hz
+HEARTBEAT_MS = 5  # how often the stall detector expects to get the event loop
+OVERLAY_LINES = 14
+
+
+def profiling_requested(argv=None):
+    argv = sys.argv if argv is None else argv
+    return "--profile" in argv or os.environ.get("WHATCANIMAKE_PROFILE", "") not in ("", "0")
+
+
+class Profiler(QObject):
+    """
+    Collects named timings. record() appends one JSON line to the log and
+    keeps the latest ones for the overlay.
+    """
+
+    recorded = Signal()
+
+    def __init__(self, enabled=False, log_path=None, parent=None):
+        super().__init__(parent)
+        self.enabled = enabled
+        self.log_path = log_path or os.environ.get(
+            "WHATCANIMAKE_PROFILE_LOG", os.path.join(APP_DIR, "profile_log.jsonl")
+        )
+        self.recent = deque(maxlen=OVERLAY_LINES)
+        self.stalls = 0
+        self._log_file = None
+        self._heartbeat = None
+
+    def record(self, name, ms, **fields):
+        if not self.enabled:
+            return
+        entry = {"t": round(time.time(), 3), "name": name, "ms": round(ms, 3), **fields}
+        if self._log_file is None:
+            self._log_file = open(self.log_path, "a", encoding="utf-8")
+        self._log_file.write(json.dumps(entry) + "\n")
+        self._log_file.flush()
+        self.recent.append(entry)
+        self.recorded.emit()
+
+    def log_event(self, name, **fields):
+        """A point in time worth logging (navigation etc.), no duration."""
+        self.record(name, 0.0, **fields)
+
+    @contextmanager
+    def span(self, name, **fields):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000, **fields)
+
+    def phases(self, name):
+        return Phases(self, name)
+
+    def watch_event_loop(self):
+        """Log every stretch longer than STALL_MS where the event loop couldn't run a timer."""
+        if not self.enabled or self._heartbeat is not None:
+            return
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setTimerType(Qt.PreciseTimer)
+        self._heartbeat.setInterval(HEARTBEAT_MS)
+        self._heartbeat.timeout.connect(self._on_heartbeat)
+        self._heartbeat.start()
+
+    def _on_heartbeat(self):
+        late = self._clock.restart() - HEARTBEAT_MS
+        if late > STALL_MS:
+            self.stalls += 1
+            self.record("event_loop_stall", late)
+
+    def close(self):
+        if self._heartbeat is not None:
+            self._heartbeat.stop()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+
+class Phases:
+    """Lap timer for a multi step function: mark("step") records the time since the previous mark."""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = self.last = time.perf_counter() if profiler.enabled else 0.0
+
+    def mark(self, phase):
+        if not self.profiler.enabled:
+            return
+        now = time.perf_counter()
+        self.profiler.record(f"{self.name}.{phase}", (now - self.last) * 1000)
+        self.last = now
+
+    def done(self):
+        if self.profiler.enabled:
+            self.profiler.record(self.name, (time.perf_counter() - self.start) * 1000)
+
+
+class FrameTimer:
+    """
+    Frame pacing of an animation: connect tick() to a per-frame signal, the
+    summary is recorded when finish() is called.
+    """
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.frames = []
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._last = 0
+
+    def tick(self, *_):
+        now = self._clock.elapsed()
+        self.frames.append(now - self._last)
+        self._last = now
+
+    def finish(self):
+        if not self.frames:
+            return
+        self.profiler.record(
+            self.name, float(self._clock.elapsed()), frames=len(self.frames),
+            max_frame_ms=max(self.frames), mean_frame_ms=round(sum(self.frames) / len(self.frames), 2),
+            late_frames=sum(1 for ms in self.frames if ms > STALL_MS),
+        )
+
+
+class ProfilerOverlay(QLabel):
+    """Translucent list of the latest timings over a window, F12 shows/hides it."""
+
+    def __init__(self, profiler, window):
+        super().__init__(window)
+        self.profiler = profiler
+        self.setObjectName("ProfilerOverlay")  # styled by the app wide theme
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.PlainText)
+        self.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.hide()
+        self.shortcut = QShortcut(QKeySequence(Qt.Key_F12), window)
+        self.shortcut.activated.connect(self.toggle)
+        profiler.recorded.connect(self.refresh)
+
+    def toggle(self):
+        self.setVisible(not self.isVisible())
+        if self.isVisible():
+            self.refresh()
+            self.raise_()
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+        lines = [f"stalls > {STALL_MS} ms: {self.profiler.stalls}"]
+        lines += [f"{e['ms']:8.1f} ms  {e['name']}" for e in reversed(self.profiler.recent)]
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - 12, 48)
+
+
+_profiler = None
+
+
+def profiler():
+    """The app wide profiler, enabled if profiling_requested() at first use."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler(enabled=profiling_requested())
+    return _profiler
@@ -0,0 +1,172 @@
+# theme.py
+from string import Template
+
+# Palette tokens, the only place colors are spelled out
+PALETTE = {
+    "window": "#1f1f1f",
+    "main_background": "#000000",
+    "surface": "#2c2c2c",
+    "surface_hover": "#353535",
+    "input": "#333333",
+    "control": "#444444",
+    "control_hover": "#555555",
+    "active": "#ff4444",
+    "heart": "#ff5555",
+    "text": "#ffffff",
+    "text_muted": "#bbbbbb",
+    "chrome": "#282a36",
+    "chrome_control": "#44475a",
+    "chrome_highlight": "#6272a4",
+    "chrome_text": "#f8f8f2",
+    "scroll_track": "#1e1e1e",
+    "overlay": "rgba(0, 0, 0, 190)",
+}
+
+# One sheet for the whole app. Screens are told apart by objectName, so every
+# screen rule starts with an id and outranks the #MainContainer base rule.
+STYLESHEET = Template("""
+QMainWindow {
+    background-color: $window;
+    border-radius: 10px;
+}
+QWidget#MainContainer, #MainContainer QWidget {
+    background-color: $window;
+    border-radius: 10px;
+}
+
+/* Title bar */
+QWidget#CustomTitleBar {
+    background-color: $chrome;
+}
+#CustomTitleBar QPushButton {
+    color: $chrome_text;
+    background-color: $chrome_control;
+    border: none;
+    border-radius: 5px;
+}
+#CustomTitleBar QPushButton:hover {
+    background-color: $chrome_highlight;
+}
+#CustomTitleBar QLabel {
+    color: $chrome_text;
+    font-size: 14px;
+    padding-left: 8px;
+}
+
+/* Main screen */
+#MainScreen, #MainScreen QWidget {
+    background-color: $main_background;
+    color: $text;
+}
+#MainScreen QPushButton#btnMake {
+    border: none;
+    background: transparent;
+}
+
+/* Cocktail book and the detail dialog */
+#CocktailBook, #CocktailBook QWidget, QDialog#CocktailDetail, #CocktailDetail QWidget {
+    background-color: $window;
+    color: $text;
+}
+#CocktailBook QLineEdit {
+    background-color: $input;
+    border: 1px solid $control;
+    border-radius: 6px;
+    padding: 6px;
+}
+#CocktailBook QListView {
+    background-color: $surface;
+    border: none;
+}
+#CocktailBook QPushButton, #CocktailDetail QPushButton {
+    background-color: $control;
+    border: none;
+    padding: 8px 12px;
+    margin: 4px;
+    border-radius: 6px;
+}
+#CocktailBook QPushButton:hover, #CocktailDetail QPushButton:hover {
+    background-color: $control_hover;
+}
+#CocktailBook QPushButton:checked, #CocktailDetail QPushButton[favorite="true"] {
+    background-color: $active;
+}
+#CocktailBook QScrollBar:vertical {
+    border: none;
+    background: $scroll_track;
+    width: 12px;
+    margin: 0px 0px 0px 0px;
+    border-radius: 6px;
+}
+#CocktailBook QScrollBar::handle:vertical {
+    background: $chrome_control;
+    min-height: 20px;
+    border-radius: 6px;
+}
+#CocktailBook QScrollBar::handle:vertical:hover {
+    background: $chrome_highlight;
+}
+#CocktailBook QScrollBar::add-line:vertical, #CocktailBook QScrollBar::sub-line:vertical {
+    height: 0;
+    background: none;
+}
+#CocktailBook QScrollBar::add-page:vertical, #CocktailBook QScrollBar::sub-page:vertical {
+    background: none;
+}
+#CocktailBook QComboBox {
+    background-color: $control;
+    border: none;
+    padding: 8px 12px;
+    margin: 4px;
+    border-radius: 6px;
+    color: $text;
+}
+#CocktailBook QComboBox:hover {
+    background-color: $control_hover;
+}
+#CocktailBook QComboBox::drop-down {
+    border: none;
+    background: transparent;
+}
+
+/* Bar screen */
+#BarScreen, #BarScreen QWidget {
+    background-color: $window;
+    color: $text;
+}
+#BarScreen QListWidget {
+    background-color: $surface;
+    border: none;
+    border-radius: 6px;
+    padding: 4px;
+}
+
+/* Profiling overlay (--profile, F12) */
+QLabel#ProfilerOverlay {
+    background-color: $overlay;
+    color: $chrome_text;
+    font-family: monospace;
+    font-size: 11px;
+    padding: 6px;
+    border-radius: 6px;
+}
+""")
+
+
+def build_stylesheet(palette=PALETTE):
+    return STYLESHEET.substitute(palette)
+
+
+def apply_theme(app, palette=PALETTE):
+    """Set the app wide stylesheet, once at startup. Widgets don't get their own."""
+    app.setStyleSheet(build_stylesheet(palette))
+
+
+def set_state(widget, name, value):
+    """
+    Set a dynamic property used by the stylesheet (e.g. favorite) and
+    re-polish just that widget so the matching rules apply.
+    """
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
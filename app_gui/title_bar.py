@@ -11,7 +11,6 @@ class TitleBar(QWidget):
 
         # Title label (centered)
         self.title = QLabel("Elon's Bar")
-        self.title.setStyleSheet("color: #f8f8f2; font-size: 14px; padding-left: 8px;")
         self.title.setAlignment(Qt.AlignCenter)
 
         # Buttons
@@ -22,7 +21,6 @@ class TitleBar(QWidget):
         for btn in [self.btnGoBack, self.btnMinimize, self.btnClose]:
             btn.setFixedSize(40, 30)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.setStyleSheet("border: none;")
 
             # Layout
         layout = QHBoxLayout(self)
@@ -41,25 +39,6 @@ class TitleBar(QWidget):
         # Drag support
         self.oldPos = None
 
-        # Style
-        self.setStyleSheet("""
-            QWidget#CustomTitleBar {
-                background-color: #282a36;
-            }
-            QPushButton {
-                color: #f8f8f2;
-                background-color: #44475a;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #6272a4;
-            }
-            QLabel {
-                color: #f8f8f2;
-                font-size: 14px;
-            }
-        """)
-
     def toggle_max_restore(self):
         if self.parent.isMaximized():
             self.parent.showNormal()
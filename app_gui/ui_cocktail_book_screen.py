@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'cocktail_book_screen.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QFrame, QHBoxLayout,
+    QLabel, QLineEdit, QListView, QPushButton,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        if not Form.objectName():
+            Form.setObjectName(u"Form")
+        Form.resize(589, 453)
+        self.verticalLayout = QVBoxLayout(Form)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(Form)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.lbl_title = QLabel(self.widget)
+        self.lbl_title.setObjectName(u"lbl_title")
+
+        self.horizontalLayout.addWidget(self.lbl_title)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.frame = QFrame(Form)
+        self.frame.setObjectName(u"frame")
+        self.frame.setFrameShape(QFrame.Shape.StyledPanel)
+        self.frame.setFrameShadow(QFrame.Shadow.Raised)
+        self.horizontalLayout_2 = QHBoxLayout(self.frame)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.label = QLabel(self.frame)
+        self.label.setObjectName(u"label")
+        font = QFont()
+        font.setFamilies([u"Levenim MT"])
+        font.setPointSize(12)
+        self.label.setFont(font)
+
+        self.horizontalLayout_2.addWidget(self.label)
+
+        self.name_search = QLineEdit(self.frame)
+        self.name_search.setObjectName(u"name_search")
+
+        self.horizontalLayout_2.addWidget(self.name_search)
+
+
+        self.verticalLayout.addWidget(self.frame)
+
+        self.widget_2 = QWidget(Form)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.btn_favorites = QPushButton(self.widget_2)
+        self.btn_favorites.setObjectName(u"btn_favorites")
+        self.btn_favorites.setCheckable(True)
+
+        self.horizontalLayout_3.addWidget(self.btn_favorites)
+
+        self.btn_easy = QPushButton(self.widget_2)
+        self.btn_easy.setObjectName(u"btn_easy")
+        self.btn_easy.setCheckable(True)
+
+        self.horizontalLayout_3.addWidget(self.btn_easy)
+
+        self.btn_stirred = QPushButton(self.widget_2)
+        self.btn_stirred.setObjectName(u"btn_stirred")
+        self.btn_stirred.setCheckable(True)
+
+        self.horizontalLayout_3.addWidget(self.btn_stirred)
+
+        self.combo_flavor = QComboBox(self.widget_2)
+        self.combo_flavor.setObjectName(u"combo_flavor")
+
+        self.horizontalLayout_3.addWidget(self.combo_flavor)
+
+
+        self.verticalLayout.addWidget(self.widget_2, 0, Qt.AlignmentFlag.AlignLeft)
+
+        self.list_cocktails = QListView(Form)
+        self.list_cocktails.setObjectName(u"list_cocktails")
+
+        self.verticalLayout.addWidget(self.list_cocktails)
+
+
+        self.retranslateUi(Form)
+
+        QMetaObject.connectSlotsByName(Form)
+    # setupUi
+
+    def retranslateUi(self, Form):
+        Form.setWindowTitle(QCoreApplication.translate("Form", u"Form", None))
+        self.lbl_title.setText(QCoreApplication.translate("Form", u"cocktailbook", None))
+        self.label.setText(QCoreApplication.translate("Form", u"Search By Name", None))
+        self.btn_favorites.setText(QCoreApplication.translate("Form", u"favorites", None))
+        self.btn_easy.setText(QCoreApplication.translate("Form", u"easy to make", None))
+        self.btn_stirred.setText(QCoreApplication.translate("Form", u"stirred", None))
+        self.combo_flavor.setPlaceholderText(QCoreApplication.translate("Form", u"Flavor", None))
+    # retranslateUi
+
+UI_SOURCE_HASH = '4d2c8b0ac4cb184d5ba279b0fa9ad67d'
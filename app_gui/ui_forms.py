@@ -0,0 +1,78 @@
+# ui_forms.py
+"""
+Designer forms compiled to Python, with QUiLoader as the fallback.
+
+    python -m app_gui.ui_forms
+
+regenerates app_gui/ui_<form>.py for every .ui file (needs pyside6-uic).
+A compiled form is only used while it matches its .ui file, so editing a
+form in Designer keeps working before the next build.
+"""
+import hashlib
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+from PySide6.QtCore import QFile
+from PySide6.QtUiTools import QUiLoader
+from PySide6.QtWidgets import QWidget
+
+UI_DIR = Path(__file__).parent
+SOURCE_HASH_PREFIX = "UI_SOURCE_HASH = "
+
+
+def ui_path(form):
+    return UI_DIR / f"{form}.ui"
+
+
+def source_hash(form):
+    return hashlib.blake2b(ui_path(form).read_bytes(), digest_size=16).hexdigest()
+
+
+def compiled_form(form):
+    """The compiled module of a form, or None if it is missing or older than the .ui file."""
+    try:
+        module = importlib.import_module(f"app_gui.ui_{form}")
+    except ImportError:
+        return None
+    if getattr(module, "UI_SOURCE_HASH", None) != source_hash(form):
+        return None
+    return module
+
+
+def load_form(form, parent=None):
+    """
+    Build a form ("main_screen", "cocktail_book_screen"...) as a widget
+    owned by parent. Widgets are found with findChild either way.
+    """
+    module = compiled_form(form)
+    if module is not None:
+        ui_class = next(getattr(module, name) for name in dir(module) if name.startswith("Ui_"))
+        widget = QWidget(parent)
+        widget.form = ui_class()  # keeps the generated attributes (widget.form.btnMake...)
+        widget.form.setupUi(widget)
+        return widget
+
+    loader = QUiLoader()
+    ui_file = QFile(str(ui_path(form)))
+    ui_file.open(QFile.ReadOnly)
+    widget = loader.load(ui_file, parent)
+    ui_file.close()
+    return widget
+
+
+def build_forms(uic="pyside6-uic"):
+    """Compile every .ui file next to this module into ui_<form>.py."""
+    for path in sorted(UI_DIR.glob("*.ui")):
+        form = path.stem
+        target = UI_DIR / f"ui_{form}.py"
+        code = subprocess.run([uic, str(path)], check=True, capture_output=True, text=True).stdout
+        code = code.rstrip() + f"\n\n{SOURCE_HASH_PREFIX}{source_hash(form)!r}\n"
+        with open(target, "w", encoding="utf-8", newline="\r\n") as f:
+            f.write(code)
+        print(f"{path.name} -> {target.name}")
+
+
+if __name__ == "__main__":
+    build_forms(*sys.argv[1:])
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'main_screen.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QLabel, QPushButton, QSizePolicy,
+    QWidget)
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        if not Form.objectName():
+            Form.setObjectName(u"Form")
+        Form.resize(650, 520)
+        Form.setMinimumSize(QSize(0, 0))
+        Form.setTabletTracking(True)
+        Form.setAutoFillBackground(True)
+        Form.setStyleSheet(u"")
+        self.lbl_headline = QLabel(Form)
+        self.lbl_headline.setObjectName(u"lbl_headline")
+        self.lbl_headline.setGeometry(QRect(240, 145, 171, 31))
+        font = QFont()
+        font.setFamilies([u"Perpetua"])
+        font.setPointSize(22)
+        self.lbl_headline.setFont(font)
+        self.btnMake = QPushButton(Form)
+        self.btnMake.setObjectName(u"btnMake")
+        self.btnMake.setGeometry(QRect(410, 210, 180, 270))
+        font1 = QFont()
+        font1.setFamilies([u"Perpetua"])
+        font1.setPointSize(16)
+        self.btnMake.setFont(font1)
+        self.btnBar = QPushButton(Form)
+        self.btnBar.setObjectName(u"btnBar")
+        self.btnBar.setGeometry(QRect(60, 350, 340, 130))
+        self.btnBar.setFont(font1)
+        self.btnSurprise = QPushButton(Form)
+        self.btnSurprise.setObjectName(u"btnSurprise")
+        self.btnSurprise.setGeometry(QRect(60, 210, 340, 130))
+        self.btnSurprise.setFont(font1)
+        self.make_rectangle = QWidget(Form)
+        self.make_rectangle.setObjectName(u"make_rectangle")
+        self.make_rectangle.setGeometry(QRect(20, 30, 190, 80))
+        self.make_rectangle.setStyleSheet(u"QWidget {\n"
+"    background-color: #360033 ;\n"
+"    border-radius: 15px;\n"
+"}")
+        self.lbl_can_make = QLabel(self.make_rectangle)
+        self.lbl_can_make.setObjectName(u"lbl_can_make")
+        self.lbl_can_make.setGeometry(QRect(3, 10, 181, 41))
+        self.lbl_can_make.setFont(font1)
+        self.lbl_can_make.setAutoFillBackground(False)
+        self.lbl_can_make.setStyleSheet(u"QLabel {\n"
+"    color: white;\n"
+"}")
+        self.lbl_num_can_make = QLabel(self.make_rectangle)
+        self.lbl_num_can_make.setObjectName(u"lbl_num_can_make")
+        self.lbl_num_can_make.setGeometry(QRect(82, 45, 51, 31))
+        font2 = QFont()
+        font2.setFamilies([u"Perpetua"])
+        font2.setPointSize(18)
+        self.lbl_num_can_make.setFont(font2)
+        self.lbl_num_can_make.setAlignment(Qt.AlignmentFlag.AlignJustify|Qt.AlignmentFlag.AlignVCenter)
+        self.enjoyed_rectangle = QWidget(Form)
+        self.enjoyed_rectangle.setObjectName(u"enjoyed_rectangle")
+        self.enjoyed_rectangle.setGeometry(QRect(230, 30, 190, 80))
+        self.enjoyed_rectangle.setStyleSheet(u"QWidget {\n"
+"    background-color: #002d1d ;\n"
+"    border-radius: 15px;\n"
+"}")
+        self.lbl_enjoyed = QLabel(self.enjoyed_rectangle)
+        self.lbl_enjoyed.setObjectName(u"lbl_enjoyed")
+        self.lbl_enjoyed.setGeometry(QRect(26, 10, 161, 41))
+        self.lbl_enjoyed.setFont(font1)
+        self.lbl_enjoyed.setStyleSheet(u"QLabel {\n"
+"    color: white;\n"
+"}")
+        self.lbl_num_enjoyed = QLabel(self.enjoyed_rectangle)
+        self.lbl_num_enjoyed.setObjectName(u"lbl_num_enjoyed")
+        self.lbl_num_enjoyed.setGeometry(QRect(82, 45, 51, 31))
+        self.lbl_num_enjoyed.setFont(font2)
+        self.lbl_num_enjoyed.setAlignment(Qt.AlignmentFlag.AlignJustify|Qt.AlignmentFlag.AlignVCenter)
+        self.bar_rectangle = QWidget(Form)
+        self.bar_rectangle.setObjectName(u"bar_rectangle")
+        self.bar_rectangle.setGeometry(QRect(440, 30, 190, 80))
+        self.bar_rectangle.setStyleSheet(u"QWidget {\n"
+"    background-color: #3b0000 ;\n"
+"    border-radius: 15px;\n"
+"}")
+        self.lbl_total = QLabel(self.bar_rectangle)
+        self.lbl_total.setObjectName(u"lbl_total")
+        self.lbl_total.setGeometry(QRect(20, 10, 181, 41))
+        self.lbl_total.setFont(font1)
+        self.lbl_total.setStyleSheet(u"QLabel {\n"
+"    color: white;\n"
+"}")
+        self.lbl_num_total = QLabel(self.bar_rectangle)
+        self.lbl_num_total.setObjectName(u"lbl_num_total")
+        self.lbl_num_total.setGeometry(QRect(82, 45, 51, 31))
+        self.lbl_num_total.setFont(font2)
+        self.lbl_num_total.setAutoFillBackground(False)
+        self.lbl_num_total.setAlignment(Qt.AlignmentFlag.AlignJustify|Qt.AlignmentFlag.AlignVCenter)
+
+        self.retranslateUi(Form)
+
+        QMetaObject.connectSlotsByName(Form)
+    # setupUi
+
+    def retranslateUi(self, Form):
+        Form.setWindowTitle(QCoreApplication.translate("Form", u"Form", None))
+        self.lbl_headline.setText(QCoreApplication.translate("Form", u"Make a Cocktail", None))
+        self.btnMake.setText(QCoreApplication.translate("Form", u"cocktails I can Make", None))
+        self.btnBar.setText(QCoreApplication.translate("Form", u"My Bar", None))
+        self.btnSurprise.setText(QCoreApplication.translate("Form", u"Surprise Me", None))
+        self.lbl_can_make.setText(QCoreApplication.translate("Form", u"Cocktails You Can Make", None))
+        self.lbl_num_can_make.setText(QCoreApplication.translate("Form", u"20", None))
+        self.lbl_enjoyed.setText(QCoreApplication.translate("Form", u"Cocktails Enjoyed", None))
+        self.lbl_num_enjoyed.setText(QCoreApplication.translate("Form", u"20", None))
+        self.lbl_total.setText(QCoreApplication.translate("Form", u"Total bar ingredients", None))
+        self.lbl_num_total.setText(QCoreApplication.translate("Form", u"20", None))
+    # retranslateUi
+
+UI_SOURCE_HASH = 'cb4d21937092b78e8f61d00dd83f68e0'
@@ -0,0 +1,181 @@
+# run_benchmarks.py
+"""
+Headless benchmarks for the data and search hot paths.
+
+    python -m benchmarks.run_benchmarks --sizes 1000 10000 100000 --json results.json
+    python -m benchmarks.run_benchmarks --baseline results.json --tolerance 1.3
+
+Recipe books and inventories are synthetic (seeded, so runs are comparable).
+With --baseline, a benchmark whose median got slower than baseline * tolerance
+is reported and the exit code is 1, so it can gate a CI job.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from app_database.cocktail_filter import CocktailFilterIndex
+from app_database.makeable_index import MakeableIndex
+from utilities import canonicalize, remove_diacritics, get_inventory_hash, get_recipe_hash
+
+DEFAULT_SIZES = (1000, 10000, 100000)  # 1M works too, but needs a few GB of RAM
+FLAVORS = ["Fruity & Tropical", "Bitter & Herbal", "Floral & Aromatic", "Sour & Tart", "Sweet & Dessert-Like"]
+BASE_NAMES = ["Negroni", "Margarita", "Mojito", "Daiquiri", "Old Fashioned", "Espresso Martini", "Gin Fizz",
+              "Piña Colada", "Caipirinha", "Café Brûlot", "Paloma", "Sazerac", "Gimlet", "Aperol Spritz"]
+# Spellings that go through the diacritics and synonym handling of canonicalize
+INGREDIENTS = ["gin", "London Dry Gin", "vodka", "white rum", "Rhum Agricole", "freshly squeezed lime juice",
+               "lime juice", "lemon juice", "simple syrup", "Campari", "sweet vermouth", "triple sec", "Cointreau",
+               "club soda", "mint", "tequila", "bourbon", "Angostura bitters", "champagne", "Crème de cassis",
+               "Café liqueur", "espresso", "sugar", "honey syrup", "Grand Marnier", "Curaçao", "absinthe",
+               "maraschino liqueur", "egg white", "orgeat"]
+RARE_INGREDIENTS = 2000  # long tail, so the ingredient vocabulary grows with the book
+SEARCHES = ["n", "ne", "neg", "negr", "negro", "marg", "piña", "espreso martni"]  # typed one key at a time
+
+
+def make_recipe_book(size, seed=1):
+    """{ name: cocktail dict } shaped like CocktailDB.cache."""
+    rng = random.Random(seed)
+    rare = [f"rare ingredient {i}" for i in range(RARE_INGREDIENTS)]
+    book = {}
+    for i in range(size):
+        name = f"{rng.choice(BASE_NAMES)} {i}"
+        ingredients = rng.sample(INGREDIENTS, rng.randint(2, 5))
+        if rng.random() < 0.2:
+            ingredients.append(rng.choice(rare))
+        book[name] = {
+            "name": name,
+            "ingredients": {ingredient: f"{rng.randint(1, 4) * 0.5} oz" for ingredient in ingredients},
+            "made_from": ", ".join(ingredients),
+            "flavor": rng.choice(FLAVORS),
+            "prep_method": rng.choice(["Stirred", "Shaken", "Built"]),
+            "is_favorite": rng.random() < 0.1,
+            "is_easy_to_make": rng.random() < 0.5,
+            "times_made": rng.randint(0, 10),
+        }
+    return book
+
+
+def make_inventory(size=20, seed=2):
+    """{ ingredient: info } shaped like InventoryDB.cache."""
+    rng = random.Random(seed)
+    return {ingredient: {"quantity": 1} for ingredient in rng.sample(INGREDIENTS, size)}
+
+
+def measure(fn, repeat, setup=None):
+    """Median/min seconds of fn() over `repeat` runs, setup() (untimed) before each run."""
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {"median": statistics.median(times), "min": min(times), "runs": repeat}
+
+
+def filter_chain(filter_index, cocktails):
+    """What refresh_cocktail_list does minus the model: typing a few searches with the toggles in between."""
+    for text in SEARCHES:
+        [cocktails[i] for i in filter_index.filter(search_text=text)]
+    for favorites, easy, stirred, flavor in ((True, False, False, "All"), (False, True, True, "Sour & Tart"),
+                                             (False, False, False, "Bitter & Herbal")):
+        [cocktails[i] for i in filter_index.filter("", favorites, easy, stirred, flavor)]
+
+
+def benchmarks_for(book, inventory):
+    """(name, fn, setup) for every benchmark on one recipe book."""
+    names = [ingredient for cocktail in book.values() for ingredient in cocktail["ingredients"]]
+    cocktail_names = list(book)
+    cocktails = list(book.values())
+    index = MakeableIndex(book, inventory)
+    filter_index = CocktailFilterIndex(cocktails)
+
+    def fresh_filter_index():
+        nonlocal filter_index
+        filter_index = CocktailFilterIndex(cocktails)
+
+    def toggle_stock():
+        index.add_ingredient("bourbon")
+        index.remove_ingredient("bourbon")
+
+    return [
+        ("canonicalize_cold", lambda: list(map(canonicalize, names)), canonicalize.cache_clear),
+        ("canonicalize_warm", lambda: list(map(canonicalize, names)), None),
+        ("remove_diacritics", lambda: list(map(remove_diacritics, cocktail_names)), None),
+        ("get_inventory_hash", lambda: get_inventory_hash(inventory), None),
+        ("get_recipe_hash", lambda: get_recipe_hash(book), None),
+        ("makeable_index_build", lambda: MakeableIndex(book, inventory), None),
+        ("makeable_toggle_ingredient", toggle_stock, None),
+        ("makeable_list", lambda: index.get_makeable_cocktails(), lambda: setattr(index, "_makeable_list", None)),
+        ("filter_index_build", lambda: CocktailFilterIndex(cocktails), None),
+        ("filter_chain", lambda: filter_chain(filter_index, cocktails), fresh_filter_index),
+        ("filter_chain_cached", lambda: filter_chain(filter_index, cocktails), None),  # flipping back and forth
+    ]
+
+
+def run(sizes, repeat, only=None):
+    results = {}
+    inventory = make_inventory()
+    for size in sizes:
+        book = make_recipe_book(size)
+        for name, fn, setup in benchmarks_for(book, inventory):
+            if only and not any(part in name for part in only):
+                continue
+            key = f"{name}[{size}]"
+            results[key] = measure(fn, repeat, setup)
+            print(f"{key:<40} {results[key]['median'] * 1000:>10.3f} ms  (min {results[key]['min'] * 1000:.3f})")
+        del book
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """[(benchmark, baseline median, new median)] for the benchmarks slower than baseline * tolerance."""
+    slower = []
+    for key, result in results.items():
+        before = baseline.get(key)
+        if before is not None and result["median"] > before["median"] * tolerance:
+            slower.append((key, before["median"], result["median"]))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the data and search hot paths without a GUI.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="recipe book sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--only", nargs="+", help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results JSON of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="allowed slowdown against the baseline, 1.25 = 25%% slower")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.only)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        slower = regressions(results, baseline, args.tolerance)
+        for key, before, after in slower:
+            print(f"REGRESSION {key}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms ({after / before:.2f}x)")
+        if slower:
+            return 1
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
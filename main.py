@@ -1,19 +1,113 @@
+import os
 import sys
+import time
 from PySide6.QtCore import Qt, QPoint
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
-    QHBoxLayout, QPushButton, QLabel, QStackedWidget
+    QHBoxLayout, QPushButton, QLabel, QStackedWidget, QMessageBox
 )
 
 # Imports from your code:
 from app_database.cocktail_db import CocktailDB
 from app_database.inventory_db import InventoryDB
+from app_database.makeable_index import MakeableIndex
+from app_database.cocktail_record import compact_cache
+from app_database.event_log import CocktailEventLog
+from app_database.sqlite_db import DEFAULT_DB_PATH, SQLiteCocktailDB, open_databases
 from app_gui.main_screen import MainScreen
 from app_gui.cocktail_book_screen import CocktailBookScreen
 from app_gui.bar_screen import BarScreen
 from app_gui.title_bar import TitleBar
-from utilities import slide_transition
+from app_gui.background import run_in_background
+from app_gui.makeable_store import MakeableStore
+from app_gui.profiling import profiler, ProfilerOverlay
+from app_gui.theme import apply_theme
+from utilities import slide_transition, get_inventory_hash, get_recipe_hash, load_snapshot, save_hashes
+
+
+def build_snapshot(inventory_db, cocktail_db, makeable_index):
+    """Compute the main screen counters from scratch (cold start)."""
+    return {
+        "makeable": makeable_index.makeable_keys(),
+        "times_made": sum(c.get("times_made", 0) for c in cocktail_db.cache.values()),
+        "ingredient_count": inventory_db.count_ingredients(),
+    }
+
+
+def query_snapshot(inventory_db, cocktail_db):
+    """Main screen counters straight from the SQLite indexes, nothing gets loaded."""
+    return {
+        "makeable": cocktail_db.makeable_keys(inventory_db.cache),
+        "times_made": cocktail_db.total_times_made(),
+        "ingredient_count": inventory_db.count_ingredients(),
+    }
+
+
+def open_startup_databases():
+    """
+    The SQLite store when WHATCANIMAKE_DB points to one (or the default
+    database file exists), the in-memory CocktailDB/InventoryDB otherwise.
+    """
+    db_path = os.environ.get("WHATCANIMAKE_DB")
+    if db_path or DEFAULT_DB_PATH.exists():
+        return open_databases(db_path or DEFAULT_DB_PATH)
+    return InventoryDB(), CocktailDB()
+
+
+def load_startup_data():
+    """
+    Load both DB caches and the main screen snapshot. Runs on a worker thread,
+    so nothing in here may touch widgets.
+    Returns (inventory_db, cocktail_db, makeable_index, snapshot, event_log, makeable_cocktails);
+    the index is None on a warm start, where the snapshot came from disk.
+    makeable_cocktails are the book's rows, read here on the SQLite store so
+    the GUI thread doesn't query them, None otherwise.
+    """
+    inventory_db, cocktail_db = open_startup_databases()
+    inventory_db.load_cache()
+    cocktail_db.load_cache()
+    makeable_index, snapshot = load_snapshot_data(inventory_db, cocktail_db)
+
+    # times_made/is_favorite changes live in the event log, on top of the (hashed) base data
+    event_log = CocktailEventLog()
+    event_log.load()
+    event_log.set_base_total(snapshot["times_made"])
+    event_log.apply(cocktail_db.cache)
+
+    makeable_cocktails = None
+    if isinstance(cocktail_db, SQLiteCocktailDB):
+        makeable_cocktails = cocktail_db.cache.get_many(snapshot["makeable"])
+    return inventory_db, cocktail_db, makeable_index, snapshot, event_log, makeable_cocktails
+
+
+def load_snapshot_data(inventory_db, cocktail_db):
+    """The warm/cold start part of load_startup_data(), returns (makeable_index, snapshot)."""
+    if isinstance(cocktail_db, SQLiteCocktailDB):
+        # Rows are read on demand; revisions replace the hashes and the counters are
+        # indexed queries. The makeable index is only built once a screen needs it.
+        inventory_hash, recipe_hash = inventory_db.revision(), cocktail_db.revision()
+        snapshot = load_snapshot(inventory_hash, recipe_hash)
+        if snapshot is None:
+            snapshot = query_snapshot(inventory_db, cocktail_db)
+            save_hashes(inventory_hash, recipe_hash, snapshot=snapshot)
+        return None, snapshot
+
+    # Warm start: reuse the saved counters if neither cache changed since last run
+    makeable_index = None
+    inventory_hash = get_inventory_hash(inventory_db.cache)
+    recipe_hash = get_recipe_hash(cocktail_db.cache)
+    snapshot = load_snapshot(inventory_hash, recipe_hash)
+    if snapshot is None:
+        makeable_index = MakeableIndex(cocktail_db.cache, inventory_db.cache)
+        snapshot = build_snapshot(inventory_db, cocktail_db, makeable_index)
+        save_hashes(inventory_hash, recipe_hash, snapshot=snapshot)
+
+    # Keep the recipes as compact records from here on, the screens read them through the dict accessor
+    cocktail_db.cache = compact_cache(cocktail_db.cache)
+    if makeable_index is not None:
+        makeable_index.cocktail_cache = cocktail_db.cache
+    return makeable_index, snapshot
 
 
 class MainWindow(QMainWindow):
@@ -21,6 +115,8 @@ class MainWindow(QMainWindow):
 
     def __init__(self):
         super().__init__()
+        self.profiler = profiler()  # no-op unless --profile / WHATCANIMAKE_PROFILE
+        phases = self.profiler.phases("MainWindow.__init__")
 
         # --- Window Config ---
         self.setWindowTitle("Elon's app")
@@ -30,8 +126,7 @@ class MainWindow(QMainWindow):
 
         # *** 1) Main container & layout ***
         container = QWidget()
-        container.setObjectName("MainContainer")
-        container.setStyleSheet("background-color: #1f1f1f; border-radius: 10px;")
+        container.setObjectName("MainContainer")  # styled by the app wide theme
         self.setCentralWidget(container)
 
         main_layout = QVBoxLayout(container)
@@ -42,78 +137,125 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.titlebar)
         # Hook up go back
         self.titlebar.btnGoBack.clicked.connect(self.goBack)
+        phases.mark("chrome")
 
         # *** 3) Stacked Widget (below the title bar) ***
         self.stacked_widget = QStackedWidget()
         main_layout.addWidget(self.stacked_widget, 1)  # 1 = stretch factor
 
         # *** 4) Database logic + screens ***
-        self.inventory_db = InventoryDB()
-        self.cocktail_db = CocktailDB()
-        self.inventory_db.load_cache()
-        self.cocktail_db.load_cache()
-
-        self.main_screen = MainScreen(self.inventory_db, self.cocktail_db)
-        self.book_screen = CocktailBookScreen(self.inventory_db, self.cocktail_db)
-        self.bar_screen = BarScreen(self.inventory_db)
+        # The window paints right away with placeholder counters: DB loading and the
+        # makeable computation run on a worker, the book and bar screens are built
+        # on first navigation.
+        self.inventory_db = None
+        self.cocktail_db = None
+        self.snapshot = None
+        self.event_log = None
+        self.makeable_store = MakeableStore(self)  # shared by every screen
+        self.book_screen = None
+        self.bar_screen = None
+        self._pending_navigation = None  # screen asked for before the data was loaded
+        self._load_error = None  # traceback if loading the databases failed
 
+        self.main_screen = MainScreen(self.makeable_store)
         self.stacked_widget.addWidget(self.main_screen)  # index 0
-        self.stacked_widget.addWidget(self.book_screen)  # index 1
-        self.stacked_widget.addWidget(self.bar_screen)  # index 2
+        phases.mark("main_screen")
 
         # Hook up signals
         self.main_screen.open_cocktail_book.connect(self.show_book_screen)
+        self.main_screen.open_bar.connect(self.show_bar_screen)
 
         # Default screen
         self.stacked_widget.setCurrentIndex(0)
 
+        self._load_started = time.perf_counter()
+        self._startup_worker = run_in_background(
+            load_startup_data, on_done=self.on_data_loaded, on_error=self.on_load_failed
+        )
+        phases.mark("start_loading")
 
         # For window dragging
         self.oldPos = QPoint()
 
-        # Apply style
-        self.applyStyleSheet()
-        self.setStyleSheet("""
-            QMainWindow {
-                border-radius: 10px;
-                background-color: #1f1f1f;
-            }
-        """)
-
-    def applyStyleSheet(self):
-        """Dark theme + styling for the title bar."""
-        self.setStyleSheet("""
-            QWidget#TitleBar {
-                background-color: #333333;
-            }
-            QPushButton {
-                background-color: #333333;
-                color: white;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #555555;
-            }
-            QPushButton#CloseButton:hover {
-                background-color: #ff4444;
-            }
-            QLabel {
-                color: white;
-            }
-        """)
+        if self.profiler.enabled:
+            self.profiler_overlay = ProfilerOverlay(self.profiler, self)
+            self.profiler.watch_event_loop()
+        phases.done()
+
+    def on_data_loaded(self, data):
+        (self.inventory_db, self.cocktail_db, makeable_index, self.snapshot, self.event_log,
+         makeable_cocktails) = data
+        self.profiler.record("startup.load_data", (time.perf_counter() - self._load_started) * 1000,
+                             warm=makeable_index is None)
+        self.makeable_store.load(
+            self.cocktail_db.cache, self.inventory_db.cache, self.snapshot["makeable"], makeable_index,
+            makeable_cocktails,
+        )
+        self.main_screen.set_snapshot(self.snapshot)
+        self.main_screen.set_times_made(self.event_log.total_times_made())
+
+        # Warm start of the in-memory DBs: the recipes are loaded anyway, get the index ready before
+        # the bar is opened. On SQLite that would read every row, the bar screen asks for it instead.
+        if makeable_index is None and not isinstance(self.cocktail_db, SQLiteCocktailDB):
+            self.makeable_store.request_index()
+
+        pending, self._pending_navigation = self._pending_navigation, None
+        if pending is not None:
+            pending()
+
+    def on_load_failed(self, error):
+        self._load_error = error
+        self._pending_navigation = None  # nothing to show, the message box says why
+        self.profiler.log_event("startup.load_failed", error=error)
+        self.show_load_error()
+
+    def show_load_error(self):
+        box = QMessageBox(QMessageBox.Critical, "Loading failed",
+                          "The cocktail and inventory databases couldn't be loaded, "
+                          "so the book and the bar aren't available.", QMessageBox.Ok, self)
+        box.setDetailedText(self._load_error)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.open()
 
     # *** 6) Navigation ***
     def show_book_screen(self):
-        self.book_screen.refresh_cocktail_list()
+        if self.cocktail_db is None:  # still loading, go there once the data is in
+            if self._load_error is not None:
+                self.show_load_error()
+                return
+            self._pending_navigation = self.show_book_screen
+            return
+
+        # The book keeps itself up to date through makeable_store.changed, nothing to recompute here
+        if self.book_screen is None:
+            with self.profiler.span("book_screen.build"):
+                self.book_screen = CocktailBookScreen(
+                    self.inventory_db, self.cocktail_db, self.makeable_store, self.event_log
+                )
+            self.book_screen.times_made_changed.connect(self.main_screen.set_times_made)
+            self.stacked_widget.addWidget(self.book_screen)
         # self.stacked_widget.setCurrentWidget(self.book_screen)
         slide_transition(self.stacked_widget, self.stacked_widget.indexOf(self.book_screen))
 
+    def show_bar_screen(self):
+        if self.inventory_db is None:  # still loading, go there once the data is in
+            if self._load_error is not None:
+                self.show_load_error()
+                return
+            self._pending_navigation = self.show_bar_screen
+            return
+
+        if self.bar_screen is None:
+            with self.profiler.span("bar_screen.build"):
+                self.bar_screen = BarScreen(self.inventory_db, self.makeable_store)
+            self.stacked_widget.addWidget(self.bar_screen)
+        slide_transition(self.stacked_widget, self.stacked_widget.indexOf(self.bar_screen))
+
     def show_main_screen(self):
         # self.stacked_widget.setCurrentWidget(self.main_screen)
         slide_transition(self.stacked_widget, self.stacked_widget.indexOf(self.main_screen))
     def goBack(self):
-        print("You clicked Go Back")
-        # E.g. go to your main screen or handle custom logic:
+        self.profiler.log_event("navigation", to="main")
         self.show_main_screen()
 
     # *** 7) Implement window dragging ***
@@ -130,6 +272,7 @@ class MainWindow(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
+    apply_theme(app)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
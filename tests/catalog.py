@@ -0,0 +1,40 @@
+# catalog.py
+import random
+
+INGREDIENTS = [
+    "Gin", "London Dry Gin", "Vodka", "White Rum", "Campari", "Sweet Vermouth", "Dry Vermouth",
+    "Fresh Lime Juice", "Lemon Juice", "Simple Syrup", "Angostura Bitters", "Triple Sec",
+    "Tonic Water", "Soda Water", "Champagne", "Mint", "Sugar", "Orange Curaçao", "Bourbon", "Grenadine",
+]
+FLAVORS = ["Bitter", "Sweet", "Sour", "Sweet & Sour", "Dry", ""]
+
+
+def random_catalog(size, seed=0):
+    """{name: cocktail dict} with the ingredient shapes the app reads (dict, list, string)."""
+    rng = random.Random(seed)
+    catalog = {}
+    for n in range(size):
+        name = f"Cocktail {n}"
+        names = rng.sample(INGREDIENTS, rng.randint(1, 5))
+        shape = n % 3
+        if shape == 0:
+            ingredients = {ingredient: f"{rng.randint(1, 60)} ml" for ingredient in names}
+        elif shape == 1:
+            ingredients = names
+        else:
+            ingredients = ", ".join(names)
+        catalog[name] = {
+            "name": name,
+            "ingredients": ingredients,
+            "flavor": rng.choice(FLAVORS),
+            "prep_method": rng.choice(["Stirred", "Shaken", "Built"]),
+            "is_favorite": rng.random() < 0.2,
+            "is_easy_to_make": rng.random() < 0.5,
+            "times_made": rng.randint(0, 5),
+        }
+    return catalog
+
+
+def random_inventory(seed=0, size=8):
+    rng = random.Random(seed)
+    return {name: {"name": name} for name in rng.sample(INGREDIENTS, size)}
@@ -0,0 +1,77 @@
+# test_cocktail_filter.py
+import itertools
+
+from app_database.cocktail_filter import CocktailFilterIndex
+from tests.catalog import random_catalog
+
+
+def passes_toggles(c, favorites=False, easy=False, stirred=False, flavor="All"):
+    return ((not favorites or c.get("is_favorite"))
+            and (not easy or c.get("is_easy_to_make"))
+            and (not stirred or c.get("prep_method") == "Stirred")
+            and (flavor == "All" or flavor.lower() in c.get("flavor", "").lower()))
+
+
+def test_every_toggle_combination_matches_a_brute_force_pass():
+    cocktails = list(random_catalog(400, seed=1).values())
+    index = CocktailFilterIndex(cocktails)
+    for search_text, flavor in [("", "All"), ("", "Sweet"), ("", "sour"), ("cocktail 1", "All"), ("gin", "Dry")]:
+        searched = CocktailFilterIndex(cocktails).search_matches(search_text)
+        candidates = range(len(cocktails)) if searched is None else searched
+        for favorites, easy, stirred in itertools.product((False, True), repeat=3):
+            expected = [i for i in candidates if passes_toggles(cocktails[i], favorites, easy, stirred, flavor)]
+            assert index.filter(search_text, favorites, easy, stirred, flavor) == expected
+
+
+def test_narrowing_a_search_gives_the_same_matches_as_a_fresh_one():
+    cocktails = list(random_catalog(400, seed=2).values())
+    index = CocktailFilterIndex(cocktails)
+    for search_text in ["c", "co", "cock", "cocktail 3", "cocktail 31", "cocktail 3", "tail 1", "tail 1x", "gin"]:
+        assert index.search_matches(search_text) == CocktailFilterIndex(cocktails).search_matches(search_text)
+
+
+def test_set_favorite_keeps_the_favorites_filter_in_step():
+    cocktails = list(random_catalog(100, seed=3).values())
+    index = CocktailFilterIndex(cocktails)
+    before = index.filter(favorites=True)
+    i = next(i for i, c in enumerate(cocktails) if not c["is_favorite"])
+
+    cocktails[i]["is_favorite"] = True
+    index.set_favorite(i, True)
+    assert index.filter(favorites=True) == sorted(before + [i])
+    index.set_favorite(i, True)  # no change
+    assert index.filter(favorites=True) == sorted(before + [i])
+
+    cocktails[i]["is_favorite"] = False
+    index.set_favorite(i, False)
+    assert index.filter(favorites=True) == before
+
+
+def test_repeated_filters_come_from_the_result_cache(monkeypatch):
+    monkeypatch.setattr("app_database.cocktail_filter.RESULT_CACHE_SIZE", 2)
+    cocktails = list(random_catalog(100, seed=4).values())
+    index = CocktailFilterIndex(cocktails)
+    everything = index.filter()
+    sweet = index.filter(flavor="Sweet")
+    assert index.filter(flavor=" sweet ") is sweet  # same key once normalized
+    assert index.filter() is everything
+
+    index.filter(easy=True)  # evicts the least recently used, flavor="Sweet"
+    assert index.filter() is everything
+    assert index.filter(flavor="Sweet") is not sweet
+    assert index.filter(flavor="Sweet") == sweet
+
+
+def test_set_favorite_only_drops_the_favorites_results():
+    cocktails = list(random_catalog(100, seed=3).values())
+    index = CocktailFilterIndex(cocktails)
+    everything = index.filter()
+    easy = index.filter(easy=True)
+    favorites = index.filter(favorites=True)
+    i = next(i for i, c in enumerate(cocktails) if not c["is_favorite"])
+
+    cocktails[i]["is_favorite"] = True
+    index.set_favorite(i, True)
+    assert index.filter() is everything
+    assert index.filter(easy=True) is easy
+    assert index.filter(favorites=True) == sorted(favorites + [i])
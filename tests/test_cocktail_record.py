@@ -0,0 +1,55 @@
+# test_cocktail_record.py
+from app_database.cocktail_record import CocktailRecord, IngredientTable, compact_cache
+from tests.catalog import random_catalog
+
+
+def test_round_trips_every_field():
+    catalog = random_catalog(60, seed=1)
+    catalog["Cocktail 0"]["instructions"] = "Stir with ice."
+    catalog["Cocktail 1"]["made_from"] = ", ".join(catalog["Cocktail 1"]["ingredients"])
+    records = compact_cache(catalog, IngredientTable())
+    assert list(records) == list(catalog)
+    for key, cocktail in catalog.items():
+        assert records[key] == cocktail
+        assert records[key].to_dict() == cocktail
+        assert list(records[key]) == [field for field in records[key].to_dict()]
+
+
+def test_flags_that_are_not_bools_are_kept_as_they_are():
+    data = {"name": "Negroni", "is_favorite": 1, "is_easy_to_make": None}
+    record = CocktailRecord(data, IngredientTable())
+    assert record["is_favorite"] == 1 and record["is_favorite"] is not True
+    assert record["is_easy_to_make"] is None
+    assert record.to_dict() == data
+
+    record["is_favorite"] = True
+    assert record["is_favorite"] is True
+    record["is_favorite"] = "yes"
+    assert record["is_favorite"] == "yes"
+    assert record.to_dict() == {"name": "Negroni", "is_favorite": "yes", "is_easy_to_make": None}
+
+
+def test_missing_fields_and_defaults():
+    record = CocktailRecord({"name": "Negroni"}, IngredientTable())
+    assert "flavor" not in record
+    assert record.get("flavor", "") == ""
+    assert record.get("is_favorite") is None
+    assert record.ingredient_names() is None
+    assert len(record) == 1
+
+
+def test_setting_ingredients_keeps_made_from():
+    table = IngredientTable()
+    record = CocktailRecord({"name": "Gimlet", "ingredients": ["Gin", "Lime"], "made_from": "Gin, Lime"}, table)
+    record["ingredients"] = {"Gin": "60 ml", "Lime": "20 ml", "Sugar": "1 tsp"}
+    assert record["made_from"] == "Gin, Lime"
+    assert record.ingredient_names() == ["Gin", "Lime", "Sugar"]
+    assert record["ingredients"] == {"Gin": "60 ml", "Lime": "20 ml", "Sugar": "1 tsp"}
+    assert table.names == ["Gin", "Lime", "Sugar"]
+
+
+def test_unusual_ingredient_shapes_stay_in_the_overflow():
+    data = {"name": "Odd", "ingredients": [{"name": "Gin"}]}
+    record = CocktailRecord(data, IngredientTable())
+    assert record.ingredient_names() is None
+    assert record["ingredients"] == [{"name": "Gin"}]
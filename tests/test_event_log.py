@@ -0,0 +1,70 @@
+# test_event_log.py
+from app_database.event_log import CocktailEventLog
+
+
+def open_log(tmp_path):
+    log = CocktailEventLog(log_path=str(tmp_path / "events.jsonl"), state_path=str(tmp_path / "stats.json"))
+    log.load()
+    return log
+
+
+def test_events_survive_a_restart(tmp_path):
+    log = open_log(tmp_path)
+    log.record_made("Negroni")
+    log.record_made("Negroni", count=2)
+    log.set_favorite("Mojito", True)
+    log.close()
+
+    log = open_log(tmp_path)
+    assert log.made_total == 3
+    assert log.times_made("Negroni", base=1) == 4
+    assert log.is_favorite("Mojito")
+    assert not log.is_favorite("Negroni")
+
+
+def test_compaction_keeps_the_counts(tmp_path):
+    log = open_log(tmp_path)
+    log.record_made("Negroni")
+    log.compact()
+    log.record_made("Negroni")
+    log.close()
+
+    log = open_log(tmp_path)
+    assert log.made_total == 2
+    assert (tmp_path / "events.jsonl").read_text() == ""
+
+
+def test_torn_line_alone_does_not_swallow_the_next_event(tmp_path):
+    (tmp_path / "events.jsonl").write_text('{"op": "made", "key": "Neg')  # crash mid-write
+    log = open_log(tmp_path)
+    log.record_made("Negroni")
+    log.record_made("Negroni")
+    log.close()
+
+    assert open_log(tmp_path).made_total == 2
+
+
+def test_replayed_events_already_in_the_state_file_are_not_counted_twice(tmp_path):
+    log = open_log(tmp_path)
+    log.record_made("Negroni")
+    log.close()
+    events = (tmp_path / "events.jsonl").read_text()
+    log = open_log(tmp_path)  # compacts
+    log.close()
+    (tmp_path / "events.jsonl").write_text(events)  # as if the truncate didn't happen
+
+    log = open_log(tmp_path)
+    log.record_made("Negroni")
+    log.close()
+    assert open_log(tmp_path).made_total == 2
+
+
+def test_overlay_on_a_cocktail_cache(tmp_path):
+    log = open_log(tmp_path)
+    cache = {"Negroni": {"name": "Negroni", "times_made": 2, "is_favorite": False}}
+    log.record_made("Negroni")
+    log.set_favorite("Negroni", True)
+    log.apply(cache)
+    assert cache["Negroni"]["times_made"] == 3
+    assert cache["Negroni"]["is_favorite"] is True
+    log.close()
@@ -0,0 +1,29 @@
+# test_hashing.py
+from utilities import get_entry_hash, get_inventory_hash, get_recipe_hash, hash_entries, merkle_root
+from tests.catalog import random_catalog, random_inventory
+
+
+def test_recipe_hash_does_not_depend_on_the_load_order():
+    catalog = random_catalog(50, seed=1)
+    reordered = dict(reversed(list(catalog.items())))
+    assert get_recipe_hash(reordered) == get_recipe_hash(catalog)
+
+
+def test_any_changed_entry_changes_the_hash():
+    catalog = random_catalog(50, seed=1)
+    before = get_recipe_hash(catalog)
+    catalog["Cocktail 7"] = dict(catalog["Cocktail 7"], times_made=99)
+    assert get_recipe_hash(catalog) != before
+
+    inventory = random_inventory(seed=2)
+    before = get_inventory_hash(inventory)
+    inventory.popitem()
+    assert get_inventory_hash(inventory) != before
+
+
+def test_entry_hashes_are_stable():
+    # the digests are saved between runs, they must not depend on dict order or the process
+    assert get_entry_hash("Gin", {"a": 1, "b": 2}) == get_entry_hash("Gin", {"b": 2, "a": 1})
+    assert get_entry_hash("Gin", {"a": 1}) == "ee30427ef0b802870ec4d4258a2e0040"
+    entries = hash_entries({"Gin": {}, "Vodka": {}})
+    assert merkle_root(entries) == merkle_root(dict(reversed(list(entries.items()))))
@@ -0,0 +1,80 @@
+# test_importer.py
+import json
+
+import pytest
+
+from app_database.importer import import_file, import_records, normalize_record
+from app_database.sqlite_db import open_databases
+
+
+@pytest.fixture
+def cocktail_db(tmp_path):
+    _, cocktail_db = open_databases(tmp_path / "test.sqlite3")
+    cocktail_db.load_cache()
+    yield cocktail_db
+    cocktail_db.close()
+
+
+def stored_ingredients(cocktail_db, name):
+    return sorted(ingredient for (ingredient,) in cocktail_db.conn.execute(
+        "SELECT ingredient FROM cocktail_ingredients JOIN cocktails ON id = cocktail_id WHERE name = ?", (name,)
+    ))
+
+
+def test_bad_records_are_skipped_and_the_rest_imported(tmp_path, cocktail_db):
+    lines = [
+        json.dumps({"name": "Negroni", "ingredients": {"Gin": "30 ml", "Campari": "30 ml"}}),
+        '{"name": "Torn',
+        json.dumps(["not", "a", "recipe"]),
+        json.dumps({"name": "  "}),
+        json.dumps({"name": "Bad count", "times_made": "many"}),
+        json.dumps({"name": "NEGRONI", "ingredients": ["Gin"]}),
+        json.dumps({"name": "Gimlet", "ingredients": "Gin, Fresh Lime Juice", "is_favorite": "yes",
+                    "times_made": "3.0"}),
+    ]
+    path = tmp_path / "recipes.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    stats = import_file(path, cocktail_db, batch_size=3)
+    assert stats == {"read": 7, "imported": 2, "duplicates": 1, "skipped": 4}
+    assert list(cocktail_db.cache) == ["Negroni", "Gimlet"]
+    gimlet = cocktail_db.cache["Gimlet"]
+    assert gimlet["ingredients"] == ["Gin", "Fresh Lime Juice"]
+    assert gimlet["made_from"] == "Gin, Fresh Lime Juice"
+    assert gimlet["is_favorite"] is True
+    assert gimlet["times_made"] == 3
+    assert stored_ingredients(cocktail_db, "Gimlet") == ["gin", "lime"]
+
+
+def test_source_names_are_kept_and_canonical_names_indexed():
+    record = normalize_record({"name": " Mojito ", "ingredients": [
+        {"name": "White Rum", "amount": "50 ml"}, {"name": "Freshly Squeezed Lime Juice", "amount": "25 ml"},
+        {"name": "Lime", "amount": "1"},
+    ]})
+    assert record["name"] == "Mojito"
+    assert record["ingredients"] == {"White Rum": "50 ml", "Freshly Squeezed Lime Juice": "25 ml", "Lime": "1"}
+    assert record["made_from"] == "White Rum, Freshly Squeezed Lime Juice, Lime"
+    assert record["_canonical"] == ["lime", "white rum"]
+
+
+def test_duplicates_are_checked_against_the_database(cocktail_db):
+    cocktail_db.cache["Negroni"] = {"name": "Negroni", "ingredients": ["Gin", "Campari"]}
+    stats = import_records(
+        [{"name": "NEGRONI", "ingredients": ["Gin"]}, {"name": "Négroni"}, {"name": "Americano"},
+         {"name": "americano"}],
+        cocktail_db,
+    )
+    assert stats == {"read": 4, "imported": 1, "duplicates": 3, "skipped": 0}
+    assert list(cocktail_db.cache) == ["Negroni", "Americano"]
+    assert cocktail_db.cache["Negroni"]["ingredients"] == ["Gin", "Campari"]
+
+
+def test_importing_twice_adds_nothing(tmp_path, cocktail_db):
+    path = tmp_path / "recipes.csv"
+    path.write_text('name,ingredients,times_made\nNegroni,"Gin, Campari",1\nGimlet,"[""Gin""]",2\n',
+                    encoding="utf-8")
+    assert import_file(path, cocktail_db)["imported"] == 2
+    revision = cocktail_db.revision()
+    assert import_file(path, cocktail_db) == {"read": 2, "imported": 0, "duplicates": 2, "skipped": 0}
+    assert cocktail_db.revision() == revision
+    assert cocktail_db.total_times_made() == 3
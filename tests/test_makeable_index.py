@@ -0,0 +1,90 @@
+# test_makeable_index.py
+import random
+
+from app_database.makeable_index import MakeableIndex, inventory_ingredients, recipe_ingredients
+from utilities import canonicalize
+from tests.catalog import INGREDIENTS, random_catalog, random_inventory
+
+
+def rescan(catalog, inventory):
+    """Makeable keys and missing ingredients the slow way, every recipe against the inventory."""
+    in_stock = inventory_ingredients(inventory)
+    missing = {key: recipe_ingredients(c) - in_stock for key, c in catalog.items()}
+    return [key for key in catalog if not missing[key]], missing
+
+
+def assert_matches_rescan(index, catalog, inventory):
+    makeable, missing = rescan(catalog, inventory)
+    assert index.makeable_keys() == makeable
+    assert index.get_makeable_cocktails() == [catalog[key] for key in makeable]
+    for key in catalog:
+        assert index.missing_ingredients(key) == missing[key]
+    expected_almost = sorted(
+        ((key, missing[key]) for key in catalog if 1 <= len(missing[key]) <= 2),
+        key=lambda item: (len(item[1]), list(catalog).index(item[0])),
+    )
+    assert index.almost_makeable(max_missing=2) == expected_almost
+    assert index.almost_makeable(max_missing=2, limit=5) == expected_almost[:5]
+
+
+def test_matches_a_rescan_after_every_change():
+    catalog = random_catalog(300, seed=1)
+    inventory = random_inventory(seed=2)
+    index = MakeableIndex(catalog, inventory)
+    assert_matches_rescan(index, catalog, inventory)
+
+    rng = random.Random(3)
+    for _ in range(60):
+        ingredient = rng.choice(INGREDIENTS)
+        before = set(index.makeable)
+        if ingredient in inventory:
+            del inventory[ingredient]
+            if canonicalize(ingredient) in inventory_ingredients(inventory):
+                # another name in stock stands for the same canonical ingredient
+                assert index.sync_inventory(inventory) == ([], [])
+            else:
+                changed = index.remove_ingredient(ingredient)
+                assert set(changed) == before - index.makeable
+        else:
+            inventory[ingredient] = {"name": ingredient}
+            changed = index.add_ingredient(ingredient)
+            assert set(changed) == index.makeable - before
+        assert_matches_rescan(index, catalog, inventory)
+
+
+def test_sync_inventory_reports_the_difference():
+    catalog = random_catalog(200, seed=4)
+    index = MakeableIndex(catalog, random_inventory(seed=5))
+    before = set(index.makeable)
+    inventory = random_inventory(seed=6)
+
+    unlocked, lost = index.sync_inventory(inventory)
+    assert set(unlocked) == index.makeable - before
+    assert set(lost) == before - index.makeable
+    assert_matches_rescan(index, catalog, inventory)
+
+
+def test_synonyms_count_as_the_same_ingredient():
+    catalog = {"Gimlet": {"name": "Gimlet", "ingredients": {"Gin": "60 ml", "Fresh Lime Juice": "20 ml"}}}
+    index = MakeableIndex(catalog, {"Gin": {}, "lime": {}})
+    assert index.makeable_keys() == ["Gimlet"]
+    assert index.remove_ingredient("freshly squeezed lime juice") == ["Gimlet"]
+
+
+def test_best_purchases_and_shopping_list():
+    catalog = {
+        "Negroni": {"name": "Negroni", "ingredients": ["Gin", "Campari", "Sweet Vermouth"]},
+        "Americano": {"name": "Americano", "ingredients": ["Campari", "Sweet Vermouth", "Soda Water"]},
+        "Gin Tonic": {"name": "Gin Tonic", "ingredients": ["Gin", "Tonic Water"]},
+        "Martini": {"name": "Martini", "ingredients": ["Gin", "Dry Vermouth"]},
+        "Boulevardier": {"name": "Boulevardier", "ingredients": ["Bourbon", "Campari", "Sweet Vermouth"]},
+    }
+    index = MakeableIndex(catalog, {"Gin": {}, "Sweet Vermouth": {}, "Soda Water": {}})
+    assert index.best_purchases() == [
+        ("campari", ["Negroni", "Americano"]), ("dry vermouth", ["Martini"]), ("tonic water", ["Gin Tonic"]),
+    ]
+    # campari unlocks two; after it bourbon, dry vermouth and tonic water unlock one each, ties go by name
+    assert index.shopping_list(budget=2) == [
+        ("campari", ["Negroni", "Americano"]), ("bourbon", ["Boulevardier"]),
+    ]
+    assert index.shopping_list(budget=0) == []
@@ -0,0 +1,97 @@
+# test_search_index.py
+import pytest
+
+from app_database import search_index
+from app_database.cocktail_filter import CocktailFilterIndex
+from app_database.search_index import FuzzySearchIndex, edit_distance, words
+from tests.catalog import random_catalog
+
+COCKTAILS = [
+    {"name": "Negroni", "ingredients": ["Gin", "Campari", "Sweet Vermouth"]},
+    {"name": "Espresso Martini", "ingredients": ["Vodka", "Coffee Liqueur", "Espresso"]},
+    {"name": "Gin Tonic", "ingredients": ["Gin", "Tonic Water"]},
+    {"name": "Gimlet", "ingredients": ["Gin", "Fresh Lime Juice"]},
+    {"name": "Lime Rickey", "ingredients": ["Gin", "Lime", "Soda Water"]},
+    {"name": "Daiquiri", "ingredients": ["White Rum", "freshly squeezed lime", "Simple Syrup"]},
+]
+
+
+def names(cocktails, results):
+    return [cocktails[i]["name"] for i, _ in results]
+
+
+def brute_force(index, query, limit):
+    """Score every cocktail against every matched term, no posting is skipped."""
+    matches = [index.term_matches(word) for word in words(query)]
+    if not matches or not all(matches):
+        return []
+    totals = {}
+    for i in range(len(index.cocktails)):
+        scores = [max((similarity * index.postings[term].get(i, 0) for term, similarity in terms.items()))
+                  for terms in matches]
+        if all(scores):
+            totals[i] = sum(scores)
+    ranked = sorted(totals.items(), key=lambda item: (-item[1], len(index.cocktails[item[0]]["name"]), item[0]))
+    return [(i, total / len(matches)) for i, total in ranked[:limit]]
+
+
+def test_edit_distance_counts_transpositions_once():
+    assert edit_distance("negroni", "negorni", 2) == 1
+    assert edit_distance("martini", "martni", 2) == 1
+    assert edit_distance("gin", "rum", 1) == 2  # gives up past the bound
+
+
+def test_typos_and_ingredients_are_found():
+    index = FuzzySearchIndex(COCKTAILS)
+    assert names(COCKTAILS, index.search("negorni"))[0] == "Negroni"
+    assert names(COCKTAILS, index.search("espreso martni"))[0] == "Espresso Martini"
+    assert names(COCKTAILS, index.search("campari")) == ["Negroni"]
+    assert index.search("xqzw") == []
+
+
+def test_names_rank_above_ingredients():
+    index = FuzzySearchIndex(COCKTAILS)
+    assert names(COCKTAILS, index.search("lime"))[0] == "Lime Rickey"
+    assert set(names(COCKTAILS, index.search("lime"))) == {"Lime Rickey", "Gimlet", "Daiquiri"}
+
+
+def test_canonical_retry():
+    index = FuzzySearchIndex(COCKTAILS)
+    assert "Daiquiri" in names(COCKTAILS, index.search("freshly squeezed lime juice"))
+
+
+def test_ingredient_matches_use_canonical_names():
+    index = FuzzySearchIndex(COCKTAILS)
+    assert index.ingredient_matches("lime") == [3, 4, 5]
+    assert index.ingredient_matches("Fresh Lime Juice") == [3, 4, 5]
+    assert index.ingredient_matches("") == []
+
+
+@pytest.mark.parametrize("query", ["cocktail", "gin", "lime", "vermouth", "cocktail 1", "gin lime", "cmpari"])
+def test_capped_postings_give_the_full_scan_results(monkeypatch, query):
+    cocktails = list(random_catalog(600, seed=1).values())
+    monkeypatch.setattr(search_index, "MAX_POSTINGS_PER_TERM", 20)
+    index = FuzzySearchIndex(cocktails)
+    assert index.search(query, limit=10) == brute_force(index, query, 10)
+
+
+def test_common_words_only_scan_their_best_postings(monkeypatch):
+    cocktails = list(random_catalog(600, seed=2).values())
+    monkeypatch.setattr(search_index, "MAX_POSTINGS_PER_TERM", 20)
+    monkeypatch.setattr(search_index, "MAX_CANDIDATES", 0)  # every word counts as very common
+    index = FuzzySearchIndex(cocktails)
+    results = index.search("gin lime", limit=10)
+    assert results
+    expected = dict(brute_force(index, "gin lime", len(cocktails)))
+    for i, score in results:
+        assert expected[i] == score  # candidates may be missed, but never scored wrong
+
+
+def test_book_search_merges_name_ingredient_and_fuzzy_matches():
+    index = CocktailFilterIndex(COCKTAILS)
+    # "Lime Rickey" by name, then the other lime drinks by ingredient
+    assert index.search_matches("lime") == [4, 3, 5]
+    assert index.search_matches("gin") == [2, 0, 3, 4]
+    assert index.search_matches("negorni") == [0]
+    assert index.search_matches("xqzw") == []
+    assert index.search_matches("") is None
@@ -0,0 +1,59 @@
+# test_snapshot.py
+import pytest
+
+import utilities
+from app_database.sqlite_db import open_databases
+from utilities import SynonymEngine, canonicalize, load_hashes, load_snapshot, save_hashes
+
+SNAPSHOT = {"makeable": ["Negroni"], "times_made": 3, "ingredient_count": 2}
+
+
+@pytest.fixture
+def other_synonyms(monkeypatch):
+    """Swap in different synonym tables, as if synonyms.json had been edited."""
+    def swap(partial=None, exact=None):
+        monkeypatch.setattr(utilities, "SYNONYM_ENGINE", SynonymEngine(partial, exact))
+        canonicalize.cache_clear()
+    yield swap
+    canonicalize.cache_clear()
+
+
+def test_snapshot_round_trip(tmp_path):
+    filepath = str(tmp_path / "hashes.json")
+    assert load_hashes(filepath) == (None, None)
+    assert load_snapshot("inv", "rec", filepath) is None
+
+    save_hashes("inv", "rec", filepath, snapshot=SNAPSHOT)
+    assert load_hashes(filepath) == ("inv", "rec")
+    assert load_snapshot("inv", "rec", filepath) == SNAPSHOT
+    assert load_snapshot("inv", "changed", filepath) is None
+    assert load_snapshot("changed", "rec", filepath) is None
+
+
+def test_snapshot_is_dropped_when_the_synonyms_change(tmp_path, other_synonyms):
+    filepath = str(tmp_path / "hashes.json")
+    save_hashes("inv", "rec", filepath, snapshot=SNAPSHOT)
+    other_synonyms(exact={"lime": "lime juice"})
+    assert load_snapshot("inv", "rec", filepath) is None
+
+
+def test_sqlite_store_follows_a_synonyms_change(tmp_path, other_synonyms):
+    path = tmp_path / "test.sqlite3"
+    inventory_db, cocktail_db = open_databases(path)
+    inventory_db.load_cache()
+    cocktail_db.load_cache()
+    cocktail_db.cache["Gimlet"] = {"name": "Gimlet", "ingredients": ["Gin", "Lime Cordial"]}
+    inventory_db.cache["Gin"] = {}
+    inventory_db.cache["Rose's"] = {}
+    assert cocktail_db.makeable_keys(inventory_db.cache) == []
+    revisions = inventory_db.revision(), cocktail_db.revision()
+    cocktail_db.close()
+
+    other_synonyms(exact={"lime cordial": "lime cordial", "rose's": "lime cordial"})
+    inventory_db, cocktail_db = open_databases(path)
+    inventory_db.load_cache()
+    cocktail_db.load_cache()
+    assert cocktail_db.makeable_keys(inventory_db.cache) == ["Gimlet"]
+    assert inventory_db.revision() != revisions[0]
+    assert cocktail_db.revision() != revisions[1]
+    cocktail_db.close()
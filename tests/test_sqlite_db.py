@@ -0,0 +1,194 @@
+# test_sqlite_db.py
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from app_database.makeable_index import MakeableIndex
+from app_database.sqlite_db import MIGRATIONS, SQLiteTable, open_databases
+from tests.catalog import random_catalog, random_inventory
+
+
+@pytest.fixture
+def databases(tmp_path):
+    inventory_db, cocktail_db = open_databases(tmp_path / "test.sqlite3")
+    inventory_db.load_cache()
+    cocktail_db.load_cache()
+    yield inventory_db, cocktail_db
+    cocktail_db.close()
+
+
+def fill(inventory_db, cocktail_db, catalog, inventory):
+    cocktail_db.cache.write_many(catalog.items())
+    inventory_db.cache.write_many(inventory.items())
+
+
+def test_rows_read_back_as_written(databases):
+    inventory_db, cocktail_db = databases
+    catalog = random_catalog(120, seed=1)
+    fill(inventory_db, cocktail_db, catalog, random_inventory(seed=2))
+
+    assert len(cocktail_db.cache) == 120
+    assert list(cocktail_db.cache) == list(catalog)
+    assert dict(cocktail_db.cache.items()) == catalog
+    assert cocktail_db.cache["Cocktail 5"] == catalog["Cocktail 5"]
+    assert "Cocktail 5" in cocktail_db.cache and "Nope" not in cocktail_db.cache
+    with pytest.raises(KeyError):
+        cocktail_db.cache["Nope"]
+    assert cocktail_db.total_times_made() == sum(c["times_made"] for c in catalog.values())
+    assert inventory_db.count_ingredients() == 8
+
+
+def test_get_many_reads_in_the_given_order(databases, monkeypatch):
+    monkeypatch.setattr("app_database.sqlite_db.LOOKUP_SIZE", 7)
+    _, cocktail_db = databases
+    catalog = random_catalog(50, seed=4)
+    cocktail_db.cache.write_many(catalog.items())
+    cocktail_db.cache["Cocktail 3"]  # one of them from the row LRU
+    cocktail_db.cache.row_hook = lambda name, row: dict(row, seen=True)
+
+    names = [f"Cocktail {n}" for n in (40, 3, 12, 0, 33, 3)]
+    rows = cocktail_db.cache.get_many(names)
+    assert [row["name"] for row in rows] == names
+    assert all(row.get("seen") for row in rows if row["name"] != "Cocktail 3")
+    with pytest.raises(KeyError):
+        cocktail_db.cache.get_many(["Cocktail 1", "Nope"])
+
+
+def test_reads_from_other_threads_while_writing(databases):
+    _, cocktail_db = databases
+    cache = cocktail_db.cache
+    catalog = random_catalog(200, seed=5)
+    cache.write_many(catalog.items())
+    errors = []
+
+    def read():
+        try:
+            for _ in range(20):
+                assert len(list(cache.values())) == 200
+                assert cache["Cocktail 7"]["name"] == "Cocktail 7"
+                cache.get_many(["Cocktail 1", "Cocktail 2"])
+        except Exception as error:  # reported below, pytest doesn't see thread exceptions
+            errors.append(error)
+
+    threads = [threading.Thread(target=read) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for n in range(100):
+        cache[f"Cocktail {n}"] = dict(catalog[f"Cocktail {n}"], times_made=n)
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_old_database_files_are_migrated(tmp_path):
+    path = tmp_path / "old.sqlite3"
+    conn = sqlite3.connect(str(path))
+    conn.executescript("""
+        CREATE TABLE cocktails (
+            id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, search_name TEXT NOT NULL,
+            flavor_key TEXT NOT NULL DEFAULT '', prep_method TEXT, is_favorite INTEGER NOT NULL DEFAULT 0,
+            is_easy_to_make INTEGER NOT NULL DEFAULT 0, times_made INTEGER NOT NULL DEFAULT 0, data TEXT NOT NULL
+        );
+        CREATE INDEX cocktails_flavor ON cocktails (flavor_key);
+        CREATE INDEX cocktails_prep_method ON cocktails (prep_method);
+        CREATE INDEX cocktails_favorite ON cocktails (is_favorite);
+        CREATE INDEX cocktails_easy ON cocktails (is_easy_to_make);
+    """)
+    negroni = {"name": "Negroni", "ingredients": ["Gin", "Campari"], "times_made": 2}
+    conn.executemany("INSERT INTO cocktails (name, search_name, times_made, data) VALUES (?, ?, ?, ?)",
+                     [("Negroni", "negroni", 2, json.dumps(negroni)), ("NEGRONI", "negroni", 1, "{}")])
+    conn.commit()
+    conn.close()
+
+    inventory_db, cocktail_db = open_databases(path)
+    cocktail_db.load_cache()
+    inventory_db.load_cache()
+    conn = cocktail_db.conn
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == len(MIGRATIONS)
+    columns = [column[1] for column in conn.execute("PRAGMA table_info(cocktails)")]
+    assert columns == ["id", "name", "times_made", "data", "name_key"]
+    assert list(cocktail_db.cache) == ["Negroni"]  # the later duplicate is dropped
+    assert cocktail_db.cache["Negroni"] == negroni
+    assert cocktail_db.total_times_made() == 2
+
+    inventory_db.cache.write_many([("Gin", {}), ("Campari", {})])
+    assert cocktail_db.makeable_keys(inventory_db.cache) == ["Negroni"]
+    cocktail_db.cache["Americano"] = {"name": "Americano", "ingredients": ["Campari"]}
+    cocktail_db.close()
+
+
+def test_writes_replace_the_cached_row(databases):
+    _, cocktail_db = databases
+    cache = cocktail_db.cache
+    cache["Negroni"] = {"name": "Negroni", "ingredients": ["Gin"], "times_made": 1}
+    assert cache["Negroni"]["times_made"] == 1  # now in the row LRU
+    cache["Negroni"] = {"name": "Negroni", "ingredients": ["Gin"], "times_made": 2}
+    assert cache["Negroni"]["times_made"] == 2
+
+    del cache["Negroni"]
+    assert "Negroni" not in cache
+    with pytest.raises(KeyError):
+        del cache["Negroni"]
+
+
+def test_names_are_unique_without_case_or_diacritics(databases):
+    _, cocktail_db = databases
+    cache = cocktail_db.cache
+    cache["Négroni"] = {"name": "Négroni"}
+    with pytest.raises(sqlite3.IntegrityError):
+        cache["NEGRONI "] = {"name": "NEGRONI "}
+    assert cache.add_many([("negroni", {"name": "negroni"}, None), ("Gimlet", {"name": "Gimlet"}, None)]) == 1
+    assert list(cache) == ["Négroni", "Gimlet"]
+
+
+def test_makeable_queries_match_the_makeable_index(databases):
+    inventory_db, cocktail_db = databases
+    catalog = random_catalog(300, seed=3)
+    for seed in range(4):
+        inventory = random_inventory(seed=seed, size=6 + seed * 2)
+        inventory_db.cache.clear()
+        fill(inventory_db, cocktail_db, catalog, inventory)
+
+        expected = MakeableIndex(catalog, inventory).makeable_keys()
+        assert cocktail_db.makeable_keys(inventory_db.cache) == expected
+        assert cocktail_db.makeable_keys(inventory) == expected
+        assert cocktail_db.get_makeable_cocktails(inventory_db.cache) == [catalog[key] for key in expected]
+
+
+def test_revision_changes_on_every_write(databases):
+    inventory_db, cocktail_db = databases
+    revisions = {cocktail_db.revision()}
+    cocktail_db.cache["Negroni"] = {"name": "Negroni"}
+    revisions.add(cocktail_db.revision())
+    cocktail_db.cache["Negroni"] = {"name": "Negroni", "times_made": 1}
+    revisions.add(cocktail_db.revision())
+    del cocktail_db.cache["Negroni"]
+    revisions.add(cocktail_db.revision())
+    assert len(revisions) == 4
+
+    before = inventory_db.revision()
+    inventory_db.cache["Gin"] = {"name": "Gin"}
+    assert inventory_db.revision() != before
+
+
+def test_revision_survives_reopening(tmp_path):
+    inventory_db, cocktail_db = open_databases(tmp_path / "test.sqlite3")
+    cocktail_db.load_cache()
+    cocktail_db.cache["Negroni"] = {"name": "Negroni"}
+    revision = cocktail_db.revision()
+    cocktail_db.close()
+
+    _, cocktail_db = open_databases(tmp_path / "test.sqlite3")
+    cocktail_db.load_cache()
+    assert cocktail_db.revision() == revision
+    cocktail_db.close()
+
+
+def test_table_classes_must_implement_write(databases):
+    class NoWrite(SQLiteTable):
+        table = "inventory"
+
+    with pytest.raises(TypeError):
+        NoWrite(databases[0].conn, databases[0].lock)
@@ -0,0 +1,77 @@
+# test_synonyms.py
+import pytest
+
+from utilities import SynonymEngine, canonicalize, normalize_text
+
+# canonicalize() outputs of the regex implementation the engine replaced
+BASELINE = [
+    ("Gin", "gin"),
+    ("  Lemon  ", "lemon"),
+    ("Lime", "lime"),
+    ("Fresh Lime Juice", "lime"),
+    ("fresh lime ", "lime"),
+    ("fresh lemon juice", "lemon"),
+    ("Freshly Squeezed Lime Juice", "lime"),
+    ("freshlysqueezedlime", "lime"),
+    ("freshly squeezedlimejuice", "lime"),
+    ("lemonjuice", "lemon"),
+    ("lime   juice", "lime"),
+    ("lime\tjuice", "lime"),
+    ("Lime Cordial", "lime juice cordial"),
+    ("limes", "lime juices"),
+    ("pineapple", "pineapple juice"),
+    ("Freshly squeezed pineapple juice", "pineapple juice"),
+    ("Champagne", "sparkling wine"),
+    ("Chilled Champagne", "sparkling wine"),
+    ("Prosecco", "sparkling wine"),
+    ("Triple Sec", "orange liqueur"),
+    ("Sugar", "white sugar"),
+    ("Sugar Cube", "white sugar"),
+    ("club soda", "soda"),
+    ("soda water", "soda"),
+    ("Soda   Water", "soda   water"),
+    ("Tonic Water", "tonic water"),
+    ("Orange Curaçao", "orange curacao"),
+    ("St-Germain Elderflower Liqueur", "st-germain elderflower liqueur"),
+    ("Half-and-Half Cream", "half-and-half cream"),
+    ("Passion Fruit Purée", "passion fruit puree"),
+    ("Beyoncé", "beyonce"),
+    ("Old Tom Gin", "gin"),
+    ("Light Rum", "white rum"),
+]
+
+
+@pytest.mark.parametrize("ingredient, expected", BASELINE)
+def test_canonicalize_keeps_the_regex_era_output(ingredient, expected):
+    assert canonicalize(ingredient) == expected
+
+
+def test_takes_the_longest_partial_match():
+    engine = SynonymEngine(partial={"lime": "lime juice", "lime cordial": "cordial"})
+    assert engine.replace_partial("lime and lime cordial") == "lime juice and cordial"
+
+
+def test_a_space_in_a_phrase_matches_any_whitespace():
+    engine = SynonymEngine(partial={"freshly squeezed lime": "lime juice", "lime": "lime juice"})
+    for text in ("freshly squeezed lime", "freshlysqueezedlime", "freshly  squeezed\tlime"):
+        assert engine.replace_partial(text) == "lime juice"
+    assert engine.replace_partial("freshly squeezed orange") == "freshly squeezed orange"
+    assert engine.replace_partial("lime  soda") == "lime juice  soda"
+
+
+def test_exact_lookup_runs_after_the_partial_pass():
+    engine = SynonymEngine(partial={"champagne": "sparkling wine"}, exact={"sparkling wine": "bubbles"})
+    assert engine.canonical("champagne") == "bubbles"
+    assert engine.canonical("pink champagne") == "pink sparkling wine"
+
+
+def test_digest_follows_the_tables():
+    engine = SynonymEngine(partial={"lime": "lime juice"})
+    before = engine.digest()
+    assert SynonymEngine(partial={"lime": "lime juice"}).digest() == before
+    engine.add_partial("lemon", "lemon juice")
+    assert engine.digest() != before
+
+
+def test_normalize_text():
+    assert normalize_text("  Orange   Curaçao ") == "orange   curacao"
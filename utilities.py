@@ -1,11 +1,31 @@
 # utilities.py
 import unicodedata
-import re
 import json
 import os
+import hashlib
+from functools import lru_cache
 from PySide6.QtCore import QPropertyAnimation, QRect
 
-from PySide6.QtCore import QPropertyAnimation, QRect
+from PySide6.QtCore import QParallelAnimationGroup, QPoint, Qt
+from PySide6.QtWidgets import QLabel
+
+# Data files live next to the code, so the app runs from any working directory
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+HASHES_FILE = os.path.join(APP_DIR, "hashes_cache.json")
+
+
+SLIDE_DURATION_MS = 300
+
+
+def _snapshot_label(stack, pixmap, pos):
+    """A label showing a screen snapshot over the stack, the real screens don't move during a slide."""
+    label = QLabel(stack)
+    label.setAttribute(Qt.WA_OpaquePaintEvent)  # covers what's under it, nothing below gets repainted
+    label.setPixmap(pixmap)
+    label.setGeometry(QRect(pos, stack.size()))
+    label.show()
+    label.raise_()
+    return label
 
 
 def slide_transition(stack, new_index):
@@ -22,10 +42,17 @@ def slide_transition(stack, new_index):
     Behavior:
     ---------
     - If the new index is the same as the current one, does nothing.
-    - Animates the current screen sliding out to the left.
-    - Animates the next screen sliding in from the right.
-    - Updates the current index when animation completes.
+    - Both screens are rendered to pixmaps once and the pixmaps slide (the
+      current one out to the left, the next one in from the right), so no
+      frame lays out or repaints the real screens, however long the lists are.
+    - The current index changes right away, under the snapshots.
+    - One transition runs at a time: a request made during a slide is queued
+      (only the latest one) and starts when the slide ends.
     """
+    if getattr(stack, "_slide", None) is not None:
+        stack._slide_queued = new_index
+        return
+
     current_index = stack.currentIndex()
     if new_index == current_index:
         return
@@ -35,79 +62,137 @@ def slide_transition(stack, new_index):
 
     w, h = stack.width(), stack.height()
 
-    # Position the incoming screen off-screen to the right
-    next_widget.setGeometry(QRect(w, 0, w, h))
-    next_widget.show()
+    # Render both screens once, the incoming one laid out at its final size first
+    next_widget.setGeometry(QRect(0, 0, w, h))
+    out_label = _snapshot_label(stack, current_widget.grab(), QPoint(0, 0))
+    in_label = _snapshot_label(stack, next_widget.grab(), QPoint(w, 0))
+    stack.setCurrentIndex(new_index)
+    out_label.raise_()
+    in_label.raise_()
+
+    # Slide both snapshots in one group, it has a single finished signal
+    group = QParallelAnimationGroup(stack)
+    for label, start, end in ((out_label, QPoint(0, 0), QPoint(-w, 0)), (in_label, QPoint(w, 0), QPoint(0, 0))):
+        anim = QPropertyAnimation(label, b"pos", group)
+        anim.setDuration(SLIDE_DURATION_MS)
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        group.addAnimation(anim)
+
+    def finalize():
+        out_label.deleteLater()
+        in_label.deleteLater()
+        group.deleteLater()
+        stack._slide = None
+        queued, stack._slide_queued = getattr(stack, "_slide_queued", None), None
+        if queued is not None:
+            slide_transition(stack, queued)
 
-    # Animate current screen moving left
-    anim_out = QPropertyAnimation(current_widget, b"geometry")
-    anim_out.setDuration(300)
-    anim_out.setStartValue(QRect(0, 0, w, h))
-    anim_out.setEndValue(QRect(-w, 0, w, h))
+    from app_gui.profiling import profiler, FrameTimer  # not at the top: profiling imports utilities
+    if profiler().enabled:
+        # Frame pacing with --profile
+        stack._frame_timer = frames = FrameTimer(profiler(), "slide_transition")  # connections don't keep it alive
+        anim.valueChanged.connect(frames.tick)
+        group.finished.connect(frames.finish)
 
-    # Animate new screen moving in from the right
-    anim_in = QPropertyAnimation(next_widget, b"geometry")
-    anim_in.setDuration(300)
-    anim_in.setStartValue(QRect(w, 0, w, h))
-    anim_in.setEndValue(QRect(0, 0, w, h))
+    group.finished.connect(finalize)
+    stack._slide = group  # parented to the stack, this is just the "running" flag
+    group.start()
 
-    # When done, update the current index
-    def finalize():
-        stack.setCurrentIndex(new_index)
-        # Clear references
-        stack._anim_in = None
-        stack._anim_out = None
 
-    anim_in.finished.connect(finalize)
+def _digest(data: bytes) -> str:
+    # BLAKE2 is deterministic across runs, unlike the salted built-in hash()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 
-    # Save animations to prevent GC
-    stack._anim_in = anim_in
-    stack._anim_out = anim_out
+def _json_default(value):
+    # Compact records (see app_database.cocktail_record) hash the same as the dict they came from
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if to_dict is not None else str(value)
 
-    anim_out.start()
-    anim_in.start()
+
+def get_entry_hash(key, value) -> str:
+    """
+    Hash a single cache entry over a canonical JSON serialization
+    (sorted keys, no whitespace, UTF-8).
+    """
+    canonical = json.dumps([key, value], sort_keys=True, separators=(",", ":"),
+                           ensure_ascii=False, default=_json_default)
+    return _digest(canonical.encode("utf-8"))
+
+
+def hash_entries(cache):
+    """The per-entry hashes { key: digest } of a cache."""
+    return {key: get_entry_hash(key, value) for key, value in cache.items()}
+
+
+def merkle_root(entry_hashes) -> str:
+    """
+    Combine per-entry hashes into a single root digest, in sorted key order,
+    so the digest doesn't depend on the order the entries were loaded in.
+    """
+    combined = "".join(entry_hashes[key] for key in sorted(entry_hashes, key=str))
+    return _digest(combined.encode("ascii"))
 
 
 def get_inventory_hash(inventory_cache):
     """
-    Compute a hash of the inventory cache. We convert the dictionary to a
-    JSON string with sorted keys to ensure consistent ordering.
+    Compute a stable digest of the inventory cache. Every entry is hashed,
+    the SQLite store uses its table revisions instead.
     """
-    inventory_json = json.dumps(inventory_cache, sort_keys=True)
-    return hash(inventory_json)
+    return merkle_root(hash_entries(inventory_cache))
 
 
 def get_recipe_hash(cocktail_cache):
     """
     Similar idea as get_inventory_hash, but for the cocktail (recipe) cache.
-    Convert the cocktail_cache to a JSON string (sorted by keys) and hash it.
+    The cache is a dict of { cocktail_name: { info... }, ... }.
     """
-    # Example: the cache is a dict of { cocktail_name: { info... }, ... }
-    # We need consistent ordering, so use sort_keys=True
-    recipe_json = json.dumps(cocktail_cache, sort_keys=True)
-    return hash(recipe_json)
+    return merkle_root(hash_entries(cocktail_cache))
+
+
+def _read_hashes_file(filepath):
+    if not os.path.exists(filepath):
+        return {}
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
-def load_hashes(filepath="hashes_cache.json"):
+def load_hashes(filepath=HASHES_FILE):
     """
     Loads the stored hashes from a small JSON file. Returns (inventory_hash, recipe_hash).
     If file doesn't exist, returns (None, None).
     """
-    if not os.path.exists(filepath):
-        return None, None
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        return data.get("inventory_hash"), data.get("recipe_hash")
+    data = _read_hashes_file(filepath)
+    return data.get("inventory_hash"), data.get("recipe_hash")
+
+
+def load_snapshot(inventory_hash, recipe_hash, filepath=HASHES_FILE):
+    """
+    Returns the snapshot saved next to the hashes (makeable list, times made,
+    ingredient count), or None if either digest or the synonym tables changed
+    since it was saved.
+    """
+    data = _read_hashes_file(filepath)
+    if data.get("inventory_hash") != inventory_hash or data.get("recipe_hash") != recipe_hash:
+        return None
+    if data.get("synonyms_hash") != synonyms_hash():  # synonyms decide which recipes are makeable
+        return None
+    return data.get("snapshot")
 
 
-def save_hashes(inventory_hash, recipe_hash, filepath="hashes_cache.json"):
+def save_hashes(inventory_hash, recipe_hash, filepath=HASHES_FILE, snapshot=None):
     """
     Saves the given hashes to a JSON file, so they persist across runs.
+    An optional snapshot dict is stored with them for load_snapshot().
     """
     data = {
         "inventory_hash": inventory_hash,
         "recipe_hash": recipe_hash
     }
+    if snapshot is not None:
+        data["snapshot"] = snapshot
+        data["synonyms_hash"] = synonyms_hash()
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f)
 
@@ -117,6 +202,8 @@ def remove_diacritics(text: str) -> str:
     Removes all diacritic marks (accents) from a given text.
     For example, "Beyoncé" becomes "Beyonce".
     """
+    if text.isascii():
+        return text  # nothing to strip
     # Normalize text to separate diacritics from characters (NFD = Normal Form Decomposition)
     normalized = unicodedata.normalize('NFD', text)
     # Encode to ASCII bytes, ignoring non-ASCII characters (i.e., the diacritics)
@@ -125,120 +212,139 @@ def remove_diacritics(text: str) -> str:
     return ascii_bytes.decode('utf-8')
 
 
-def canonicalize(ingredient: str) -> str:
+def normalize_text(text: str) -> str:
     """
-    A comprehensive canonicalize function that:
-    1. Removes diacritics.
-    2. Converts to lowercase.
-    3. Applies regex replacements for partial matches (optional).
-    4. Looks up final synonyms in a dictionary.
-    """
-
-    # Step 1: Remove diacritics
-    text = remove_diacritics(ingredient)
-
-    # Step 2: Convert to lowercase
-    text = text.lower().strip()
-
-    # Step 3: Regex or substring replacements for partial matches
-    #    For example, capturing "freshly squeezed lime" or "champagne" -> "sparkling wine".
-    #    You can expand or adjust these patterns as needed.
-    pattern_synonyms = [
-        (r"(freshly\s*squeezed\s*)?lime(\s*juice)?", "lime juice"),
-        (r"(freshly\s*squeezed\s*)?lemon(\s*juice)?", "lemon juice"),
-        (r"chilled champagne", "sparkling wine"),
-        (r"champagne", "sparkling wine"),
-        (r"prosecco", "sparkling wine"),
-        (r"(freshly\s*squeezed\s*)?pineapple(\s*juice)?", "pineapple juice"),
-    ]
-    for pattern, replacement in pattern_synonyms:
-        text = re.sub(pattern, replacement, text)
-
-    # Step 4: Final dictionary lookup for exact synonyms
-    #    This dictionary is case-insensitive since we've already lowercase the input.
-    synonyms = {
-        # Fruits & vegetables / garnish
-        "lemon twist": "lemon garnish",
-        "fresh basil leaves": "basil leaves",
-        "fresh lemon juice": "lemon",
-        "lemon juice": "lemon",
-        "fresh lime juice": "lime",
-        "lime juice": "lime",
-
-        # Alcoholic synonyms
-        "tennessee whiskey": "bourbon",
-        "scotch whisky": "blended scotch whisky",
-        "old tom gin": "gin",
-        "grenadine syrup": "grenadine",
-        "passion fruit purֳ©e": "passion fruit puree",  # older accent form
-        "passion fruit puree": "passion fruit puree",
-        "St-Germain Elderflower Liqueur": "elderflower liqueur",
-        "tonic Water": "tonic",
-        "orange Curaçao": "orange liqueur",
-        "light rum": "white rum",
-        "malibu rum": "coconut rum",
-        "triple sec": "orange liqueur",
-
-        # Coffee/Tea
-        "freshly brewed espresso": "espresso",
-        "Half-and-Half Cream": "cooking cream",
-
-        # Sugar & sweeteners
-        "sugar cube": "white sugar",
-        "sugar": "white sugar",
-        "honey syrup": "honey",
-        "sugar syrup": "simple syrup",
-
-        # Others
-        "club soda": "soda",
-        "soda water": "soda",
-        "ç": "c",
-        "è": "e"
-    }
-
-    # Use the synonym dictionary if there's a direct match, otherwise return as is.
-    return synonyms.get(text, text)
+    Removes diacritics, lowercases and strips. Inner whitespace is kept,
+    partial synonyms match any run of it.
+    """
+    return remove_diacritics(text).lower().strip()
 
 
-def canonicalize_regex(ingredient: str) -> str:
+class SynonymEngine:
     """
-    An alternative approach that uses purely regex with expansions for partial matches.
+    Single-pass synonym replacement over a character trie.
+
+    - partial: substrings replaced anywhere in the text, scanning left to right
+      and always taking the longest synonym that starts at the current position.
+      A space in a phrase matches any amount of whitespace, none included, so
+      "freshly squeezed lime" also covers "freshlysqueezedlime".
+    - exact: whole-string lookups applied to the result of the partial pass,
+      keys are compared as written.
+    Cost grows with the text length, not with the number of synonyms.
     """
-    text = remove_diacritics(ingredient).lower().strip()
-
-    pattern_synonyms = [
-        (r"(freshly\s*squeezed\s*)?lime(\s*juice)?", "lime juice"),
-        (r"(freshly\s*squeezed\s*)?lemon(\s*juice)?", "lemon juice"),
-        (r"champagne", "sparkling wine"),
-        # Add more patterns as needed
-    ]
-
-    for pattern, replacement in pattern_synonyms:
-        text = re.sub(pattern, replacement, text)
 
-    return text
-
-
-def canonicalize_partial(ingredient: str) -> str:
+    _END = ""  # trie key holding the replacement; real keys are single characters
+    _SPACE = " "  # trie key of optional whitespace, the node under it loops on more whitespace
+
+    def __init__(self, partial=None, exact=None):
+        self.trie = {}
+        self.partial = {}  # phrase -> replacement, as added
+        self.exact = dict(exact or {})
+        for phrase, replacement in (partial or {}).items():
+            self.add_partial(phrase, replacement)
+
+    @classmethod
+    def from_file(cls, filepath):
+        """Build the engine from a JSON file with "partial" and "exact" tables."""
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data.get("partial"), data.get("exact"))
+
+    def add_partial(self, phrase, replacement):
+        self.partial[phrase] = replacement
+        node = self.trie
+        for k, word in enumerate(normalize_text(phrase).split()):
+            if k:
+                if self._SPACE not in node:
+                    space = node[self._SPACE] = {}
+                    space[self._SPACE] = space
+                node = node[self._SPACE]
+            for ch in word:
+                node = node.setdefault(ch, {})
+        node[self._END] = replacement
+
+    def _longest_match(self, text, i):
+        """(end, replacement) of the longest partial synonym starting at text[i], replacement None if none."""
+        match_end, replacement = i, None
+        node = self.trie.get(text[i])  # phrases don't start with whitespace
+        if node is None:
+            return match_end, replacement
+        j, n = i + 1, len(text)
+        while self._SPACE not in node:  # plain characters, one trie path
+            if self._END in node:
+                match_end, replacement = j, node[self._END]
+            if j == n:
+                return match_end, replacement
+            node = node.get(text[j])
+            if node is None:
+                return match_end, replacement
+            j += 1
+
+        states = [node]
+        while True:
+            for node in states:
+                if self._END in node:
+                    match_end, replacement = j, node[self._END]
+            if j == n:
+                return match_end, replacement
+            key = self._SPACE if text[j].isspace() else text[j]
+            following = {}  # id -> node, the whitespace loop can reach a node twice
+            for node in states:
+                # whitespace is optional: also step from the node under _SPACE, as if none was there
+                for start in (node, node.get(self._SPACE)):
+                    if start is not None:
+                        nxt = start.get(key)
+                        if nxt is not None:
+                            following[id(nxt)] = nxt
+            if not following:
+                return match_end, replacement
+            states = following.values()
+            j += 1
+
+    def replace_partial(self, text: str) -> str:
+        """Replace every partial synonym in already normalized text, longest match first."""
+        out = []
+        trie = self.trie
+        i, n = 0, len(text)
+        while i < n:
+            replacement = None
+            if text[i] in trie:  # most characters start no synonym
+                match_end, replacement = self._longest_match(text, i)
+            if replacement is None:
+                out.append(text[i])
+                i += 1
+            else:
+                out.append(replacement)
+                i = match_end
+        return "".join(out)
+
+    def canonical(self, text: str) -> str:
+        """Partial replacements followed by the exact lookup."""
+        text = self.replace_partial(text)
+        return self.exact.get(text, text)
+
+    def digest(self) -> str:
+        """Digest of both tables, changes whenever a synonym does."""
+        return _digest(json.dumps([self.partial, self.exact], sort_keys=True).encode("utf-8"))
+
+
+SYNONYM_ENGINE = SynonymEngine.from_file(os.path.join(APP_DIR, "synonyms.json"))
+
+
+def synonyms_hash() -> str:
+    """Digest of the synonym tables canonicalize() uses, saved with anything derived from it."""
+    return SYNONYM_ENGINE.digest()
+
+
+@lru_cache(maxsize=65536)
+def canonicalize(ingredient: str) -> str:
     """
-    A substring-based approach: if a substring is in the text, replace it.
-    Useful for simpler partial matches without complex regex.
+    A comprehensive canonicalize function that:
+    1. Removes diacritics.
+    2. Converts to lowercase and strips.
+    3. Applies partial synonyms, e.g. "freshly squeezed lime" or "champagne" -> "sparkling wine".
+    4. Looks up final exact synonyms.
+    Steps 3-4 use the single-pass SYNONYM_ENGINE built from synonyms.json.
+    Results are memoized, ingredient names repeat a lot across recipes.
     """
-    text = remove_diacritics(ingredient).lower()
-
-    substring_synonyms = {
-        "freshly squeezed lime": "lime juice",
-        "fresh lime": "lime juice",
-        "lime juice": "lime juice",  # final canonical form
-        "freshly squeezed lemon": "lemon juice",
-        "fresh lemon": "lemon juice",
-        "lemon juice": "lemon juice",  # final canonical form
-        "champagne": "sparkling wine",
-        # etc.
-    }
-
-    for pattern, canonical_form in substring_synonyms.items():
-        if pattern in text:
-            text = text.replace(pattern, canonical_form)
-
-    return text.strip()
+    return SYNONYM_ENGINE.canonical(normalize_text(ingredient))